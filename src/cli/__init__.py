@@ -2,8 +2,21 @@
 
 from __future__ import annotations
 
-from .dispatcher import CommandDispatcher
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dispatcher import CommandDispatcher
 
 __all__ = [
     "CommandDispatcher",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access so that importing ``src.cli.main`` (the console
+    # script) does not drag in the dispatcher and everything behind it.
+    if name == "CommandDispatcher":
+        from .dispatcher import CommandDispatcher
+
+        return CommandDispatcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
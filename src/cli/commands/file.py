@@ -22,10 +22,41 @@ from ..output import (
     print_code_block,
     print_error,
     print_info,
+    print_lines,
     print_success,
     print_warning,
 )
 
+# Maximum characters printed by ``/file show``
+_SHOW_MAX_CHARS = 4000
+
+# File extension -> Pygments lexer name for ``/file show``
+_LANGUAGE_MAP: dict[str, str] = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "tsx": "typescript",
+    "jsx": "javascript",
+    "rs": "rust",
+    "go": "go",
+    "java": "java",
+    "rb": "ruby",
+    "c": "c",
+    "cpp": "cpp",
+    "h": "c",
+    "hpp": "cpp",
+    "css": "css",
+    "html": "html",
+    "md": "markdown",
+    "json": "json",
+    "yaml": "yaml",
+    "yml": "yaml",
+    "toml": "toml",
+    "sh": "bash",
+    "bash": "bash",
+    "ps1": "powershell",
+}
+
 # ---------------------------------------------------------------------------
 # API
 # ---------------------------------------------------------------------------
@@ -139,42 +170,20 @@ def cmd_file_show(files: FileManager, path: str) -> None:
         )
         return
 
-    max_chars = 4000
-    if len(content) > max_chars:
-        display = content[:max_chars] + "\n\n\u2026 [truncated]"
-    else:
-        display = content
+    # Highlight only the visible slice and print the marker on its own,
+    # rather than concatenating a second full-size copy of the content
+    truncated = len(content) > _SHOW_MAX_CHARS
+    display = content[:_SHOW_MAX_CHARS] if truncated else content
 
     # Determine language from extension
     ext = path.rsplit(".", 1)[-1] if "." in path else ""
-    language_map = {
-        "py": "python",
-        "js": "javascript",
-        "ts": "typescript",
-        "tsx": "typescript",
-        "jsx": "javascript",
-        "rs": "rust",
-        "go": "go",
-        "java": "java",
-        "rb": "ruby",
-        "c": "c",
-        "cpp": "cpp",
-        "h": "c",
-        "hpp": "cpp",
-        "css": "css",
-        "html": "html",
-        "md": "markdown",
-        "json": "json",
-        "yaml": "yaml",
-        "yml": "yaml",
-        "toml": "toml",
-        "sh": "bash",
-        "bash": "bash",
-        "ps1": "powershell",
-    }
-    language = language_map.get(ext, "")
-
-    print_code_block(display, language=language)
+    print_code_block(display, language=_LANGUAGE_MAP.get(ext, ""))
+    if truncated:
+        note = (
+            f"\u2026 [truncated] – showing {_SHOW_MAX_CHARS:,} of "
+            f"{len(content):,} characters"
+        )
+        print_lines((note,), style="dim")
 
 
 def cmd_file_pin(
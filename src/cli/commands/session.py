@@ -15,7 +15,7 @@ Commands covered
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
 from ...context.manager import ContextManager
 from ...files.patching import PatchManager
@@ -25,6 +25,7 @@ from ..output import (
     print_context_stats,
     print_error,
     print_info,
+    print_lines,
     print_session_list,
     print_success,
 )
@@ -198,14 +199,7 @@ def cmd_snippet(
         _print_snippet_usage()
         return
 
-    dispatch = {
-        "list": _snippet_list,
-        "show": _snippet_show,
-        "del": _snippet_delete,
-        "save": _snippet_save,
-    }
-
-    handler = dispatch.get(sub)
+    handler = _SNIPPET_HANDLERS.get(sub)
     if handler:
         handler(snippets, patch, last_response, rest)
     else:
@@ -241,8 +235,7 @@ def _snippet_list(
     names = snippets.list_names()
     if names:
         print_info("Saved snippets:")
-        for name in names:
-            print(f"  \u2022 {name}")
+        print_lines(f"  \u2022 {name}" for name in names)
     else:
         print_info("No snippets saved.")
 
@@ -310,3 +303,14 @@ def _snippet_save(
 
     snippets.save(name, code)
     print_success(f"Snippet '{name}' saved ({len(code)} chars).")
+
+
+# Built once at import; ``cmd_snippet`` looks subcommands up here
+_SNIPPET_HANDLERS: dict[
+    str, Callable[[SnippetManager, PatchManager, Optional[str], str], None]
+] = {
+    "list": _snippet_list,
+    "show": _snippet_show,
+    "del": _snippet_delete,
+    "save": _snippet_save,
+}
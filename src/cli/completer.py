@@ -0,0 +1,238 @@
+"""Tab completion for the PatchPilot REPL.
+
+:class:`CLICompleter` is a pure helper (no ``readline`` dependency) that
+turns the text before the cursor into a list of candidates for the word
+being completed:
+
+  - ``/``-commands at the start of the line, via a prefix trie
+  - loaded file paths for commands that act on loaded files (``/show``, ...)
+  - subcommands and snippet names for ``/snippet``
+  - filesystem paths everywhere else
+
+The REPL's ``readline`` hook feeds it the current line buffer.
+"""
+
+from __future__ import annotations
+
+import os
+from bisect import bisect_left, insort
+from typing import Callable, Iterable, Iterator, Optional
+
+from ..files.manager import FileManager
+from ..files.snippets import SnippetManager
+from ..paths import abspath
+
+
+class _Trie:
+    """Minimal character trie over a fixed set of words."""
+
+    __slots__ = ("children", "order", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Trie] = {}
+        # Child characters in sorted order, maintained on insert
+        self.order: list[str] = []
+        self.terminal: bool = False
+
+    @classmethod
+    def build(cls, words: Iterable[str]) -> _Trie:
+        """Return a trie containing every word in *words*."""
+        root = cls()
+        for word in words:
+            node = root
+            for ch in word:
+                child = node.children.get(ch)
+                if child is None:
+                    child = node.children[ch] = cls()
+                    insort(node.order, ch)
+                node = child
+            node.terminal = True
+        return root
+
+    def descend(self, prefix: str) -> Optional[_Trie]:
+        """Return the node reached by walking *prefix*, or ``None``."""
+        node: Optional[_Trie] = self
+        for ch in prefix:
+            node = node.children.get(ch)  # type: ignore[union-attr]
+            if node is None:
+                return None
+        return node
+
+    def words(self, prefix: str) -> Iterator[str]:
+        """Yield every stored word starting with *prefix*, in sorted order."""
+        start = self.descend(prefix)
+        if start is None:
+            return
+        stack = [(prefix, start)]
+        while stack:
+            word, node = stack.pop()
+            if node.terminal:
+                yield word
+            # Push in reverse so the smallest child is popped first
+            children = node.children
+            for ch in reversed(node.order):
+                stack.append((word + ch, children[ch]))
+
+
+class CLICompleter:
+    """Context-aware completion candidates for the REPL prompt.
+
+    Parameters
+    ----------
+    get_commands:
+        Zero-arg callable returning the top-level ``/`` commands.  The
+        command trie is rebuilt only when the returned collection changes.
+    files:
+        File manager used to complete loaded file paths.
+    snippets:
+        Snippet manager used to complete snippet names (via its own
+        sorted index, see :meth:`SnippetManager.complete_prefix`).
+    """
+
+    # Commands whose argument is a filesystem path
+    _PATH_CMDS = frozenset({"/file", "/f", "/folder", "/unload-folder"})
+    # Commands whose argument is an already-loaded file
+    _LOADED_CMDS = frozenset(
+        {"/show", "/unload", "/pin", "/unpin", "/fix", "/refactor", "/patch"}
+    )
+    _SNIPPET_SUBCMDS = ("save", "list", "show", "del")
+    _SNIPPET_SUBCMD_TRIE = _Trie.build(_SNIPPET_SUBCMDS)
+    _SNIPPET_NAME_SUBCMDS = frozenset({"show", "del"})
+
+    def __init__(
+        self,
+        get_commands: Callable[[], Iterable[str]],
+        files: FileManager,
+        snippets: SnippetManager,
+    ) -> None:
+        self._get_commands = get_commands
+        self._files = files
+        self._snippets = snippets
+        self._cmd_source: Optional[Iterable[str]] = None
+        self._cmd_key: Optional[int] = None
+        self._cmd_trie = _Trie()
+        # (version, sorted lowercased names, originals in the same order) —
+        # reused until the owner's version changes
+        self._files_cache: Optional[tuple[int, list[str], list[str]]] = None
+        # abs directory -> (st_mtime_ns, sorted names, display names)
+        self._dir_cache: dict[str, tuple[int, list[str], list[str]]] = {}
+        self._command_trie()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_completions(self, line: str) -> list[str]:
+        """Return candidates for the last word of *line* (text before cursor).
+
+        Each candidate is a full replacement for that word.
+        """
+        words = line.split()
+        if line and not line[-1].isspace():
+            text = words.pop()
+        else:
+            text = ""
+
+        # Case 1: completing the command itself
+        if not words:
+            if not text or text[0] != "/":
+                return self._complete_path(text)
+            return list(self._command_trie().words(text))
+
+        # Case 2: completing an argument
+        cmd = words[0].lower()
+        if cmd[0] != "/" or cmd in self._PATH_CMDS:
+            return self._complete_path(text)
+        if cmd in self._LOADED_CMDS:
+            return self._complete_loaded(text) if len(words) == 1 else []
+        if cmd == "/snippet":
+            return self._complete_snippet(words, text)
+        return []
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _command_trie(self) -> _Trie:
+        commands = self._get_commands()
+        if commands is not self._cmd_source:
+            key = hash(tuple(commands))
+            if key != self._cmd_key:
+                self._cmd_trie = _Trie.build(commands)
+                self._cmd_key = key
+            self._cmd_source = commands
+        return self._cmd_trie
+
+    def _complete_snippet(self, words: list[str], text: str) -> list[str]:
+        if len(words) == 1:
+            return list(self._SNIPPET_SUBCMD_TRIE.words(text.lower()))
+        if len(words) == 2 and words[1].lower() in self._SNIPPET_NAME_SUBCMDS:
+            return list(self._snippets.complete_prefix(text))
+        return []
+
+    def _complete_loaded(self, text: str) -> list[str]:
+        cache = self._files_cache
+        if cache is None or cache[0] != self._files.version:
+            cache = self._sorted_index(self._files.version, self._files.loaded_paths())
+            self._files_cache = cache
+        return self._match_prefix(cache[1], cache[2], text)
+
+    @staticmethod
+    def _sorted_index(
+        version: int, names: list[str]
+    ) -> tuple[int, list[str], list[str]]:
+        pairs = sorted((n.lower(), n) for n in names)
+        return version, [low for low, _ in pairs], [orig for _, orig in pairs]
+
+    @staticmethod
+    def _match_prefix(lowered: list[str], originals: list[str], text: str) -> list[str]:
+        """Case-insensitive prefix match: O(log N + k) over a sorted index."""
+        key = text.lower()
+        i = bisect_left(lowered, key)
+        n = len(lowered)
+        matches: list[str] = []
+        while i < n and lowered[i].startswith(key):
+            matches.append(originals[i])
+            i += 1
+        return matches
+
+    def _complete_path(self, text: str) -> list[str]:
+        basedir, partial = os.path.split(text)
+        listing = self._list_dir(basedir or ".")
+        if listing is None:
+            return []
+        names, display = listing
+        i = bisect_left(names, partial)
+        n = len(names)
+        candidates: list[str] = []
+        while i < n and names[i].startswith(partial):
+            shown = display[i]
+            candidates.append(os.path.join(basedir, shown) if basedir else shown)
+            i += 1
+        return candidates
+
+    def _list_dir(self, directory: str) -> Optional[tuple[list[str], list[str]]]:
+        """Return (sorted names, names with "/" on directories) for *directory*.
+
+        Listings are cached per absolute directory and refreshed only when
+        the directory's mtime changes (i.e. an entry was added or removed).
+        """
+        key = abspath(directory)
+        try:
+            mtime = os.stat(key).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+        try:
+            with os.scandir(key) as it:
+                entries = sorted(
+                    (e.name, e.name + "/" if e.is_dir() else e.name) for e in it
+                )
+        except OSError:
+            return None
+        names = [name for name, _ in entries]
+        display = [shown for _, shown in entries]
+        self._dir_cache[key] = (mtime, names, display)
+        return names, display
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 import textwrap
-from typing import Any, ClassVar, Optional
+from typing import Any, Callable, ClassVar, Optional, Sequence
 
 from ..context.manager import ContextManager
 from ..files.manager import FileManager
@@ -68,6 +68,22 @@ Anything else is sent as a regular chat message.
 
 
 class CommandDispatcher:
+    __slots__ = (
+        "_session",
+        "_files",
+        "_patch",
+        "_snippets",
+        "_ctx",
+        "_store",
+        "_session_id",
+        "_display",
+        "_max_file_chars",
+        "_last_response",
+        "_handlers",
+        "_snip_handlers",
+        "exit_requested",
+    )
+
     COMMAND_HANDLERS: ClassVar[dict[str, str]] = {
         "/exit": "_cmd_exit",
         "/help": "_cmd_help",
@@ -84,10 +100,15 @@ class CommandDispatcher:
         "/pin": "_cmd_pin",
         "/unpin": "_cmd_unpin",
         "/context-info": "_cmd_context_info",
+        "/fix": "_cmd_fix",
+        "/refactor": "_cmd_refactor",
+        "/patch": "_cmd_patch",
         "/snippet": "_cmd_snippet",
         "/history": "_cmd_history",
         "/resume": "_cmd_resume",
     }
+    # Immutable snapshot handed out as-is to completers
+    _ALL_COMMANDS: ClassVar[tuple[str, ...]] = tuple(COMMAND_HANDLERS)
 
     def __init__(
         self,
@@ -112,6 +133,16 @@ class CommandDispatcher:
         self._store = store
         self._session_id = session_id
         self.exit_requested: bool = False
+        # Resolve handler names to bound methods once, not per dispatch
+        self._handlers: dict[str, Callable[[str], str]] = {
+            cmd: getattr(self, name) for cmd, name in self.COMMAND_HANDLERS.items()
+        }
+        self._snip_handlers: dict[str, Callable[[str], str]] = {
+            "list": self._snip_list,
+            "show": self._snip_show,
+            "del": self._snip_del,
+            "save": self._snip_save,
+        }
 
     # ------------------------------------------------------------------
     # Main entry points
@@ -123,39 +154,25 @@ class CommandDispatcher:
         if not raw:
             return True
 
-        parts = raw.split()
+        # Split once into (command, argument string); handlers that need
+        # tokens split their own argument string
+        parts = raw.split(None, 1)
         cmd = parts[0].lower()
+        args = parts[1] if len(parts) > 1 else ""
 
-        if cmd == "/exit":
-            self.exit_requested = True
-            result = self._cmd_exit()
-            result = _strip_rich_markup(result)
-            print(result)
-            return False
-
-        args_str = " ".join(parts[1:]) if len(parts) > 1 else ""
-
-        if cmd in ("/fix", "/refactor", "/patch"):
-            result = self._cmd_code_op(cmd, raw)
-            result = _strip_rich_markup(result)
-            if result:
-                print(result)
-        elif cmd in ("/history", "/resume"):
-            print(f"Use '{cmd}' in the Textual app (requires async DB).")
-        elif cmd in self.COMMAND_HANDLERS:
-            handler = getattr(self, self.COMMAND_HANDLERS[cmd])
-            result = handler(args_str) if args_str else handler()
-            result = _strip_rich_markup(result)
-            if result:
-                print(result)
-        else:
+        handler = self._handlers.get(cmd)
+        if handler is None:
             # Chat message — send to AI
             response = self._session.send(raw, record_in_history=True)
             if response:
                 print(_strip_rich_markup(response))
             self._last_response = response
+            return True
 
-        return True
+        result = _strip_rich_markup(handler(args))
+        if result:
+            print(result)
+        return not self.exit_requested
 
     async def dispatch_async(self, user_input: str) -> str:  # noqa: C901
         """Async dispatch for Textual TUI. Returns response string."""
@@ -173,12 +190,8 @@ class CommandDispatcher:
             result = await self._cmd_history_async()
         elif cmd == "/resume":
             result = await self._cmd_resume_async(args)
-        elif cmd == "/exit":
-            self.exit_requested = True
-            result = self._cmd_exit()
-        elif cmd in self.COMMAND_HANDLERS:
-            handler = getattr(self, self.COMMAND_HANDLERS[cmd])
-            result = handler(args) if args else handler()
+        elif cmd in self._handlers:
+            result = self._handlers[cmd](args)
         else:
             # Chat message — send to AI via async stream
             if self._store and self._session_id:
@@ -201,10 +214,7 @@ class CommandDispatcher:
 
     async def _collect_async_response(self, user_input: str) -> str:
         """Send a chat message via async streaming and collect the full response."""
-        full_response = ""
-        async for chunk in self._session.stream_async(user_input):
-            if chunk.content:
-                full_response += chunk.content
+        full_response = await self._session.send_async(user_input) or ""
         if full_response:
             self._last_response = full_response
         return full_response
@@ -214,6 +224,7 @@ class CommandDispatcher:
     # ------------------------------------------------------------------
 
     def _cmd_exit(self, args: str = "") -> str:
+        self.exit_requested = True
         return "Goodbye!"
 
     def _cmd_help(self, args: str = "") -> str:
@@ -254,19 +265,17 @@ class CommandDispatcher:
         return "\n".join(lines)
 
     def _cmd_show(self, args: str = "") -> str:
-        if not args.strip():
-            return "Usage: /show <path>"
         path = args.strip()
+        if not path:
+            return "Usage: /show <path>"
         content = self._files.get_content(path)
         if content is None:
             return "File not loaded. Use /file to load it first."
         max_chars = self._max_file_chars * 4
-        display_content = (
-            content
-            if len(content) <= max_chars
-            else content[:max_chars] + "\n…[truncated]"
-        )
-        return f"**{path}**\n\n```\n{display_content}\n```"
+        if len(content) <= max_chars:
+            return f"**{path}**\n\n```\n{content}\n```"
+        # Slice and build the reply in one step; no intermediate truncated copy
+        return f"**{path}**\n\n```\n{content[:max_chars]}\n…[truncated]\n```"
 
     def _cmd_unload(self, args: str = "") -> str:
         if not args.strip():
@@ -331,28 +340,48 @@ class CommandDispatcher:
 
     def _cmd_snippet(self, args: str = "") -> str:
         parts = args.split(None, 1)
-        sub = parts[0].lower() if parts else ""
-        rest = parts[1] if len(parts) > 1 else ""
-
-        if sub == "list":
-            names = self._snippets.list_names()
-            return "\n".join(names) if names else "No snippets saved."
-        if sub == "show" and rest:
-            block = self._snippets.as_context_block(rest)
-            return block if block else f"Snippet '{rest}' not found."
-        if sub == "del" and rest:
-            deleted = self._snippets.delete(rest)
-            return f"Deleted '{rest}'." if deleted else "Not found."
-        if sub == "save" and rest:
-            name = rest
-            if not self._last_response:
-                return "No assistant response to save from."
-            code = self._patch.extract_code_block(self._last_response)
-            if not code:
-                return "No code block found in last response."
-            self._snippets.save(name, code)
-            return f"Snippet '{name}' saved."
-        return "Usage: /snippet save|show|list|del [name]"
+        handler = self._snip_handlers.get(parts[0].lower() if parts else "")
+        if handler is None:
+            return self._SNIPPET_USAGE
+        return handler(parts[1] if len(parts) > 1 else "")
+
+    _SNIPPET_USAGE: ClassVar[str] = "Usage: /snippet save|show|list|del [name]"
+
+    def _snip_list(self, rest: str) -> str:
+        names = self._snippets.list_names()
+        return "\n".join(names) if names else "No snippets saved."
+
+    def _snip_show(self, rest: str) -> str:
+        if not rest:
+            return self._SNIPPET_USAGE
+        block = self._snippets.as_context_block(rest)
+        return block if block else f"Snippet '{rest}' not found."
+
+    def _snip_del(self, rest: str) -> str:
+        if not rest:
+            return self._SNIPPET_USAGE
+        deleted = self._snippets.delete(rest)
+        return f"Deleted '{rest}'." if deleted else "Not found."
+
+    def _snip_save(self, name: str) -> str:
+        if not name:
+            return self._SNIPPET_USAGE
+        if not self._last_response:
+            return "No assistant response to save from."
+        code = self._patch.extract_code_block(self._last_response)
+        if not code:
+            return "No code block found in last response."
+        self._snippets.save(name, code)
+        return f"Snippet '{name}' saved."
+
+    def _cmd_fix(self, args: str = "") -> str:
+        return self._cmd_code_op("/fix", args)
+
+    def _cmd_refactor(self, args: str = "") -> str:
+        return self._cmd_code_op("/refactor", args)
+
+    def _cmd_patch(self, args: str = "") -> str:
+        return self._cmd_code_op("/patch", args)
 
     def _cmd_history(self, args: str = "") -> str:
         """Sync stub — real implementation is async via dispatch_async."""
@@ -414,13 +443,13 @@ class CommandDispatcher:
     # Code operations (sync variant)
     # ------------------------------------------------------------------
 
-    def _cmd_code_op(self, cmd: str, raw: str) -> str:
+    def _cmd_code_op(self, cmd: str, args: str) -> str:
         """Shared sync logic for /fix, /refactor, /patch. Returns response."""
-        tokens = raw.split(None, 2)  # [cmd, path, instructions?]
-        if len(tokens) < 2:
+        parts = args.split(None, 1)  # [path, instructions?]
+        if not parts:
             return f"Usage: {cmd} <path> [instructions]"
-        path = tokens[1]
-        instructions = tokens[2].strip() if len(tokens) > 2 else ""
+        path = parts[0]
+        instructions = parts[1].strip() if len(parts) > 1 else ""
 
         if not self._files.is_loaded(path):
             ok, err = self._files.load(path)
@@ -445,7 +474,7 @@ class CommandDispatcher:
             if new_code:
                 ok, msg = self._patch.apply(path, new_code, confirm=False)
                 if ok:
-                    self._files.load(path)
+                    self._files.update_content(path, new_code)
                 return f"{response}\n\n---\n{msg}"
             return response + "\n\n---\nNo code block found in response to apply."
 
@@ -470,13 +499,12 @@ class CommandDispatcher:
         content = self._files.get_content(path) or ""
         prompt = self._build_code_prompt(cmd, path, content, instructions)
 
-        # Record user intent, then stream the structured prompt
+        # Record user intent, then stream the structured prompt (not
+        # double-recorded, matching the sync path)
         self._ctx.add_user(f"{cmd} {path}: {instructions}")
-
-        full_response = ""
-        async for chunk in self._session.stream_async(prompt):
-            if chunk.content:
-                full_response += chunk.content
+        full_response = (
+            await self._session.send_async(prompt, record_in_history=False) or ""
+        )
 
         if not full_response:
             return "No response from assistant."
@@ -487,65 +515,55 @@ class CommandDispatcher:
             if new_code:
                 ok, msg = self._patch.apply(path, new_code, confirm=False)
                 if ok:
-                    self._files.load(path)
+                    self._files.update_content(path, new_code)
                 return f"{full_response}\n\n---\n{msg}"
             return full_response + "\n\n---\nNo code block found in response to apply."
 
         return full_response
 
-    @staticmethod
-    def _build_code_prompt(cmd: str, path: str, content: str, instructions: str) -> str:
-        if cmd == "/fix":
-            return (
-                f"Fix bugs or errors in this file. Follow these instructions: "
-                f"{instructions}\n\nFile: {path}\n{content}\n\n"
-                "Provide a clear explanation of the changes and a complete "
-                "replacement file in a single fenced code block."
-            )
-        if cmd == "/refactor":
-            return (
-                f"Refactor this file to improve readability, maintainability, "
-                f"or performance according to: {instructions}\n\n"
-                f"File: {path}\n{content}\n\n"
-                "Provide a short summary and the full refactored file in a "
-                "single fenced code block."
-            )
-        # /patch
-        return (
-            f"Produce a patch (complete replacement) for this file according "
-            f"to: {instructions}\n\nFile: {path}\n{content}\n\n"
+    # Prompt bodies for /fix, /refactor and /patch.  Only the template is
+    # parsed by format_map, so braces inside file content are safe.
+    _CODE_PROMPT_TMPLS: ClassVar[dict[str, str]] = {
+        "/fix": (
+            "Fix bugs or errors in this file. Follow these instructions: "
+            "{instructions}\n\nFile: {path}\n{content}\n\n"
+            "Provide a clear explanation of the changes and a complete "
+            "replacement file in a single fenced code block."
+        ),
+        "/refactor": (
+            "Refactor this file to improve readability, maintainability, "
+            "or performance according to: {instructions}\n\n"
+            "File: {path}\n{content}\n\n"
+            "Provide a short summary and the full refactored file in a "
+            "single fenced code block."
+        ),
+        "/patch": (
+            "Produce a patch (complete replacement) for this file according "
+            "to: {instructions}\n\nFile: {path}\n{content}\n\n"
             "Provide only the replacement file in a single fenced code block."
+        ),
+    }
+
+    @classmethod
+    def _build_code_prompt(
+        cls, cmd: str, path: str, content: str, instructions: str
+    ) -> str:
+        tmpl = cls._CODE_PROMPT_TMPLS.get(cmd, cls._CODE_PROMPT_TMPLS["/patch"])
+        return tmpl.format_map(
+            {"instructions": instructions, "path": path, "content": content}
         )
 
     # ------------------------------------------------------------------
     # State Getters for Autocomplete
     # ------------------------------------------------------------------
 
-    def get_all_commands(self) -> list[str]:
-        """Return all top-level commands starting with /."""
-        return [
-            "/exit",
-            "/reset",
-            "/help",
-            "/file",
-            "/folder",
-            "/list",
-            "/show",
-            "/unload",
-            "/unload-all",
-            "/unload-folder",
-            "/unload-pattern",
-            "/pin",
-            "/unpin",
-            "/tokens",
-            "/context-info",
-            "/fix",
-            "/refactor",
-            "/patch",
-            "/snippet",
-            "/history",
-            "/resume",
-        ]
+    def get_all_commands(self) -> Sequence[str]:
+        """Return all top-level commands starting with /.
+
+        The same tuple is returned on every call, so completers can detect
+        "unchanged" by identity.
+        """
+        return self._ALL_COMMANDS
 
     def get_loaded_paths(self) -> list[str]:
         """Return list of currently loaded file paths."""
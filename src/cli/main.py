@@ -9,30 +9,25 @@ Production-quality code with type hints and docstrings.
 
 from __future__ import annotations
 
-import asyncio
+import dataclasses
 import sys
 import uuid
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
-from ..client.nvidia import NvidiaProvider
-from ..client.ollama import OllamaProvider
 from ..config import Config
-from ..context.manager import ContextManager
-from ..files.manager import FileManager
-from ..files.patching import PatchManager
-from ..files.snippets import SnippetManager
-from ..session.manager import SessionManager
-from ..session.store import SessionStore
-from .dispatcher import CommandDispatcher
-from .output import (
-    print_assistant_message,
-    print_error,
-    print_success,
-    print_warning,
-)
-from .repl import REPL
+
+# Everything below the config is imported where it is used, so ``--help``
+# (and a bare Typer error) never pays for openai / httpx / rich / aiosqlite.
+if TYPE_CHECKING:
+    from ..client.nvidia import NvidiaProvider
+    from ..client.ollama import OllamaProvider
+    from ..context.manager import ContextManager
+    from ..files.manager import FileManager
+    from ..files.patching import PatchManager
+    from ..files.snippets import SnippetManager
+    from ..session.manager import SessionManager
 
 # ---------------------------------------------------------------------------
 # Typer app
@@ -57,14 +52,19 @@ def _create_provider(config: Config) -> NvidiaProvider | OllamaProvider:
     otherwise falls back to :class:`OllamaProvider` for local inference.
     """
     if config.API_KEY:
+        from ..client.nvidia import NvidiaProvider
+
         return NvidiaProvider(
             api_key=config.API_KEY,
             base_url=config.BASE_URL,
             model=config.MODEL,
-            max_retries=getattr(config, "MAX_RETRIES", 3),
-            retry_delay=getattr(config, "RETRY_DELAY", 1.5),
+            max_retries=config.MAX_RETRIES,
+            retry_delay=config.RETRY_DELAY,
+            use_sdk=config.STREAM_VIA_SDK,
         )
     # Local fallback
+    from ..client.ollama import OllamaProvider
+
     return OllamaProvider(
         model=config.MODEL,
         base_url=config.BASE_URL,
@@ -95,6 +95,12 @@ def _create_services(
     5. Snippet manager (in-memory)
     6. Session manager (sync streaming)
     """
+    from ..context.manager import ContextManager
+    from ..files.manager import FileManager
+    from ..files.patching import PatchManager
+    from ..files.snippets import SnippetManager
+    from ..session.manager import SessionManager
+
     provider = _create_provider(config)
 
     context = ContextManager(
@@ -113,6 +119,7 @@ def _create_services(
     patch = PatchManager(
         backup=config.BACKUP_ON_WRITE,
         diff_preview=config.DIFF_PREVIEW,
+        confirm_from_pipe=config.CONFIRM_FROM_PIPE,
     )
 
     snippets = SnippetManager()
@@ -155,6 +162,14 @@ def _run_code_op(
     no_backup:
         If True, skip backup creation.
     """
+    from .dispatcher import CommandDispatcher
+    from .output import (
+        print_assistant_message,
+        print_error,
+        print_success,
+        print_warning,
+    )
+
     config = Config()
     _provider, _context, files, patch, _snippets, session = _create_services(config)
 
@@ -197,8 +212,9 @@ def _run_code_op(
         )
         if ok:
             print_success(msg)
-            # Reload so context sees the updated content
-            files.load(file)
+            if not dry_run:
+                # Context sees the written content without re-reading the file
+                files.update_content(file, new_code)
         else:
             print_error(msg)
     else:
@@ -290,7 +306,7 @@ def chat(
     """
     config = Config()
     if model:
-        config.MODEL = model  # Allow model override
+        config = dataclasses.replace(config, MODEL=model)  # Allow model override
 
     _run_repl(config)
 
@@ -308,11 +324,20 @@ def _run_repl(config: Config | None = None) -> None:
     config:
         Optional pre-built config.  Created from defaults if omitted.
     """
+    import asyncio
+    import threading
+
+    from ..session.store import SessionStore
+    from .repl import REPL
+
     if config is None:
         config = Config()
 
     provider, context, files, patch, snippets, session = _create_services(config)
 
+    # Warm the provider's connection while the DB and REPL start up
+    threading.Thread(target=provider.warmup, name="warmup", daemon=True).start()
+
     store = SessionStore(config.DB_PATH)
 
     # Single event loop for all async DB operations
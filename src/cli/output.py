@@ -23,7 +23,7 @@ import difflib
 import sys
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable, Generator
+from typing import Any, Callable, Generator, Iterable
 
 from rich import box
 from rich.console import Console, Group
@@ -92,68 +92,87 @@ def print_welcome(model: str = "PatchPilot", version: str = "1.0.0") -> None:
         console.print(f"{model} v{version} — Terminal AI code assistant")
 
 
+def _build_help_table() -> Table:
+    """Build the Rich help table listing every command."""
+    table = Table(
+        title="[title]Commands[/]",
+        title_style="title",
+        box=box.ROUNDED,
+        border_style="border",
+        header_style="bold",
+    )
+    table.add_column("Command", style="command", no_wrap=True)
+    table.add_column("Description", style="value")
+    table.add_column("Shortcut", style="hint", no_wrap=True)
+
+    rows: list[tuple[str, str, str]] = [
+        ("/exit", "Quit the assistant", "/q"),
+        ("/reset", "Clear conversation (keeps files)", ""),
+        ("/help", "Show this help", "/h"),
+        ("", "", ""),
+        ("[bold]File management[/]", "", ""),
+        ("/file <path>", "Load a file", "/f"),
+        ("/folder <path>", "Load all files from a folder", ""),
+        ("/list", "List loaded files", "/l"),
+        ("/show <path>", "Show file content", ""),
+        ("/unload <path>", "Unload a file", ""),
+        ("/unload-all", "Unload non-pinned files", ""),
+        ("/unload-folder <path>", "Unload files from a folder", ""),
+        ("/unload-pattern <glob>", "Unload files matching a glob", ""),
+        ("", "", ""),
+        ("[bold]Code operations[/]", "", ""),
+        ("/fix <path> [instr]", "Fix bugs in a file", ""),
+        ("/refactor <path> [instr]", "Refactor a file", ""),
+        ("/patch <path> [instr]", "Produce & apply a patch", ""),
+        ("", "", ""),
+        ("[bold]Snippets & Pins[/]", "", ""),
+        ("/pin <path>", "Pin a file", ""),
+        ("/unpin <path>", "Remove pin", ""),
+        ("/snippet save <name>", "Save last code block", ""),
+        ("/snippet show <name>", "Show saved snippet", ""),
+        ("/snippet list", "List snippets", ""),
+        ("/snippet del <name>", "Delete snippet", ""),
+        ("", "", ""),
+        ("[bold]Sessions[/]", "", ""),
+        ("/history", "Show recent sessions", ""),
+        ("/resume [id]", "Resume a session", ""),
+        ("", "", ""),
+        ("[bold]Info[/]", "", ""),
+        ("/tokens", "Estimate token usage", ""),
+        ("/context-info", "Detailed context stats", ""),
+    ]
+
+    for cmd, desc, shortcut in rows:
+        if not cmd and not desc:
+            table.add_section()
+            continue
+        if cmd.startswith("[bold]"):
+            table.add_section()
+            table.add_row(cmd, "", "", style="label")
+            continue
+        table.add_row(cmd, desc, shortcut)
+    return table
+
+
+_help_render_cache: dict[tuple[int, str | None], str] = {}
+"""Rendered help output keyed by ``(console width, colour system)``."""
+
+
 def print_help() -> None:
-    """Print a Rich-formatted help table with all commands."""
-    try:
-        table = Table(
-            title="[title]Commands[/]",
-            title_style="title",
-            box=box.ROUNDED,
-            border_style="border",
-            header_style="bold",
-        )
-        table.add_column("Command", style="command", no_wrap=True)
-        table.add_column("Description", style="value")
-        table.add_column("Shortcut", style="hint", no_wrap=True)
-
-        rows: list[tuple[str, str, str]] = [
-            ("/exit", "Quit the assistant", "/q"),
-            ("/reset", "Clear conversation (keeps files)", ""),
-            ("/help", "Show this help", "/h"),
-            ("", "", ""),
-            ("[bold]File management[/]", "", ""),
-            ("/file <path>", "Load a file", "/f"),
-            ("/folder <path>", "Load all files from a folder", ""),
-            ("/list", "List loaded files", "/l"),
-            ("/show <path>", "Show file content", ""),
-            ("/unload <path>", "Unload a file", ""),
-            ("/unload-all", "Unload non-pinned files", ""),
-            ("/unload-folder <path>", "Unload files from a folder", ""),
-            ("/unload-pattern <glob>", "Unload files matching a glob", ""),
-            ("", "", ""),
-            ("[bold]Code operations[/]", "", ""),
-            ("/fix <path> [instr]", "Fix bugs in a file", ""),
-            ("/refactor <path> [instr]", "Refactor a file", ""),
-            ("/patch <path> [instr]", "Produce & apply a patch", ""),
-            ("", "", ""),
-            ("[bold]Snippets & Pins[/]", "", ""),
-            ("/pin <path>", "Pin a file", ""),
-            ("/unpin <path>", "Remove pin", ""),
-            ("/snippet save <name>", "Save last code block", ""),
-            ("/snippet show <name>", "Show saved snippet", ""),
-            ("/snippet list", "List snippets", ""),
-            ("/snippet del <name>", "Delete snippet", ""),
-            ("", "", ""),
-            ("[bold]Sessions[/]", "", ""),
-            ("/history", "Show recent sessions", ""),
-            ("/resume [id]", "Resume a session", ""),
-            ("", "", ""),
-            ("[bold]Info[/]", "", ""),
-            ("/tokens", "Estimate token usage", ""),
-            ("/context-info", "Detailed context stats", ""),
-        ]
-
-        for cmd, desc, shortcut in rows:
-            if not cmd and not desc:
-                table.add_section()
-                continue
-            if cmd.startswith("[bold]"):
-                table.add_section()
-                table.add_row(cmd, "", "", style="label")
-                continue
-            table.add_row(cmd, desc, shortcut)
+    """Print a Rich-formatted help table with all commands.
 
-        console.print(table)
+    The table is rendered once per terminal width and colour system; later
+    calls write the cached ANSI string straight to the console file.
+    """
+    try:
+        key = (console.width, console.color_system)
+        rendered = _help_render_cache.get(key)
+        if rendered is None:
+            with console.capture() as capture:
+                console.print(_build_help_table())
+            rendered = _help_render_cache[key] = capture.get()
+        console.file.write(rendered)
+        console.file.flush()
     except Exception:
         console.print(
             "[command]/exit[/]  — Quit\n"
@@ -237,6 +256,29 @@ def print_system_message(text: str) -> None:
         console.print(text)
 
 
+_NOTICE_TITLES: dict[str, Text] = {
+    "error": Text("ERROR", style="error"),
+    "success": Text("SUCCESS", style="success"),
+    "warning": Text("WARNING", style="warning"),
+    "info": Text("ℹ Info", style="info"),
+}
+"""Pre-built panel titles; Panel copies them per render, so sharing is safe."""
+
+
+def _print_notice(text: str, style: str, label: str) -> None:
+    """Print *text* in a bordered panel using the pre-built *style* title."""
+    try:
+        panel = Panel(
+            Text(text, style=style),
+            title=_NOTICE_TITLES[style],
+            border_style=style,
+            padding=(1, 2),
+        )
+        console.print(panel)
+    except Exception:
+        console.print(f"{label}: {text}")
+
+
 def print_error(text: str) -> None:
     """Print a red-bordered error panel.
 
@@ -245,16 +287,7 @@ def print_error(text: str) -> None:
     text:
         Error description.
     """
-    try:
-        panel = Panel(
-            Text(text, style="error"),
-            title="[error]ERROR[/]",
-            border_style="error",
-            padding=(1, 2),
-        )
-        console.print(panel)
-    except Exception:
-        console.print(f"Error: {text}")
+    _print_notice(text, "error", "Error")
 
 
 def print_success(text: str) -> None:
@@ -265,16 +298,7 @@ def print_success(text: str) -> None:
     text:
         Success message.
     """
-    try:
-        panel = Panel(
-            Text(text, style="success"),
-            title="[success]SUCCESS[/]",
-            border_style="success",
-            padding=(1, 2),
-        )
-        console.print(panel)
-    except Exception:
-        console.print(f"Success: {text}")
+    _print_notice(text, "success", "Success")
 
 
 def print_warning(text: str) -> None:
@@ -285,16 +309,7 @@ def print_warning(text: str) -> None:
     text:
         Warning message.
     """
-    try:
-        panel = Panel(
-            Text(text, style="warning"),
-            title="[warning]WARNING[/]",
-            border_style="warning",
-            padding=(1, 2),
-        )
-        console.print(panel)
-    except Exception:
-        console.print(f"Warning: {text}")
+    _print_notice(text, "warning", "Warning")
 
 
 def print_info(text: str) -> None:
@@ -305,16 +320,29 @@ def print_info(text: str) -> None:
     text:
         Info message.
     """
+    _print_notice(text, "info", "Info")
+
+
+def print_lines(lines: Iterable[str], style: str = "default") -> None:
+    """Print several plain-text lines with a single console write.
+
+    Use instead of calling a ``print_*`` helper per line for lists whose
+    length depends on user data (snippet names, loaded files, ...).
+
+    Parameters
+    ----------
+    lines:
+        Lines to print (no trailing newlines).  Markup is not interpreted.
+    style:
+        Named style applied to the whole block.
+    """
+    block = "\n".join(lines)
+    if not block:
+        return
     try:
-        panel = Panel(
-            Text(text, style="info"),
-            title="[info]ℹ Info[/]",
-            border_style="info",
-            padding=(1, 2),
-        )
-        console.print(panel)
+        console.print(Text(block, style=style))
     except Exception:
-        console.print(f"Info: {text}")
+        console.file.write(block + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -436,8 +464,7 @@ def print_file_list(
 
         console.print(table)
     except Exception:
-        for p in paths:
-            console.print(p)
+        print_lines(paths)
 
 
 def print_context_stats(stats: dict[str, Any]) -> None:
@@ -523,8 +550,9 @@ def print_session_list(sessions: list[dict[str, Any]]) -> None:
 
         console.print(table)
     except Exception:
-        for s in sessions:
-            console.print(f"{s.get('id', '?')}  {s.get('title', 'Untitled')}")
+        print_lines(
+            f"{s.get('id', '?')}  {s.get('title', 'Untitled')}" for s in sessions
+        )
 
 
 # ---------------------------------------------------------------------------
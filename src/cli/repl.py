@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import time
 from typing import Optional
 
 # readline is not available on Windows; provide a no-op fallback.
@@ -54,6 +55,7 @@ from .commands.session import (
     cmd_resume,
     cmd_snippet,
 )
+from .completer import CLICompleter
 from .dispatcher import CommandDispatcher
 from .output import (
     console,
@@ -76,6 +78,8 @@ from .output import (
 _HISTFILE = os.path.expanduser("~/.patchpilot_history")
 _HISTORY_MAX = 2000
 _RICH_TAG_RE = None  # Unused in the REPL — we display via Rich directly
+# Minimum seconds between Live re-renders while tokens are streaming
+_STREAM_FLUSH_INTERVAL = 0.016
 
 
 # ---------------------------------------------------------------------------
@@ -95,23 +99,31 @@ class _StreamingDisplay:
     ------------------------------------
     - ``stream(text)`` — called with each content delta
     - ``reasoning(text)`` — called with reasoning content (ignored here)
+    - ``flush_stream()`` — render any deltas still held back by ``stream``
     - ``newline()`` — called at the end of streaming
     - ``info(text)`` — informational message (interruption, status)
     - ``error(text)`` — error message
     """
 
     def __init__(self) -> None:
-        self._accumulated: str = ""
+        self._parts: list[str] = []
         self._ctx: Optional[streaming_context] = None  # type: ignore[assignment]
         self._update = None
         self._started: bool = False
+        # Deltas received since the last Live update, and when that was
+        self._pending: bool = False
+        self._last_flush: float = 0.0
 
     def reasoning(self, text: str) -> None:
         """Called when the provider streams reasoning tokens (ignored in CLI)."""
         pass  # Reasoning is typically verbose — omit from CLI output
 
     def stream(self, text: str) -> None:
-        """Called with each content chunk from the provider."""
+        """Called with each content chunk from the provider.
+
+        Deltas are buffered; the Live view is re-rendered only on a newline
+        or once ``_STREAM_FLUSH_INTERVAL`` has passed since the last render.
+        """
         if not self._started:
             # Begin the Live display on first content token
             self._started = True
@@ -121,31 +133,44 @@ class _StreamingDisplay:
             )
             self._live.start()
 
-        self._accumulated += text
-        if self._started and hasattr(self, "_live"):
+        self._parts.append(text)
+        self._pending = True
+        if (
+            "\n" in text
+            or time.monotonic() - self._last_flush >= _STREAM_FLUSH_INTERVAL
+        ):
+            self.flush_stream()
+
+    def flush_stream(self) -> None:
+        """Render buffered deltas into the Live view, if any are pending."""
+        if not self._pending:
+            return
+        self._pending = False
+        self._last_flush = time.monotonic()
+        if getattr(self, "_live", None) is not None:
             try:
-                self._live.update(Text(self._accumulated))
+                self._live.update(Text("".join(self._parts)))
             except Exception:
                 pass
 
     def newline(self) -> None:
         """Finalise streaming and print the complete response."""
         self._cleanup_live()
-        if self._accumulated:
-            print_assistant_message(self._accumulated)
-            self._accumulated = ""
+        if self._parts:
+            print_assistant_message("".join(self._parts))
+            self._parts = []
 
     def info(self, text: str) -> None:
         """Display an informational / status message (e.g. stream cancelled)."""
         self._cleanup_live()
         # Reset accumulated so we don't re-print stale text
-        self._accumulated = ""
+        self._parts = []
         print_system_message(text.strip())
 
     def error(self, text: str) -> None:
         """Display an error message."""
         self._cleanup_live()
-        self._accumulated = ""
+        self._parts = []
         print_error(text.strip())
 
     def _cleanup_live(self) -> None:
@@ -157,6 +182,7 @@ class _StreamingDisplay:
                 pass
             self._live = None
         self._started = False
+        self._pending = False
 
     def __del__(self) -> None:
         self._cleanup_live()
@@ -222,7 +248,26 @@ class REPL:
         self._running = False
         self._last_response: Optional[str] = None
 
-        # Readline history
+        # One Rich-aware display and one session bound to it, shared by
+        # every streamed chat / code request.  The adapter resets itself
+        # in newline() / info() / error(), so it is safe to reuse.
+        self._display = _StreamingDisplay()
+        self._stream_session = SessionManager(
+            provider=self._provider,
+            context=self._context,
+            display=self._display,
+            temperature=self._config.TEMPERATURE,
+            max_tokens=self._config.MAX_RESPONSE_TOKENS,
+        )
+
+        # Tab completion + readline history
+        self._completer = CLICompleter(
+            get_commands=lambda: self._COMMANDS,
+            files=self._files,
+            snippets=self._snippets,
+        )
+        # Candidates for the Tab press in progress (see _tab_complete)
+        self._tab_candidates: list[str] = []
         self._setup_readline()
 
     # ------------------------------------------------------------------
@@ -246,7 +291,9 @@ class REPL:
 
         readline.set_history_length(_HISTORY_MAX)  # type: ignore[union-attr]
 
-        # Tab completion
+        # Tab completion — split words on whitespace only so "/cmd" and
+        # "dir/file" reach the completer as single words
+        readline.set_completer_delims(" \t\n")  # type: ignore[union-attr]
         readline.set_completer(self._tab_complete)  # type: ignore[union-attr]
         readline.parse_and_bind("tab: complete")  # type: ignore[union-attr]
 
@@ -265,63 +312,20 @@ class REPL:
             pass
 
     def _tab_complete(self, text: str, state: int) -> Optional[str]:
-        """Simple tab completion for commands and file paths."""
+        """Readline completer hook — delegates to :class:`CLICompleter`.
+
+        Readline calls this with ``state`` 0, 1, 2, ... for one Tab press;
+        candidates are computed at state 0 and served from that list.
+        """
         if readline is None:
             return None
 
-        # Build candidate list
-        commands = [
-            "/exit",
-            "/quit",
-            "/q",
-            "/help",
-            "/h",
-            "/reset",
-            "/tokens",
-            "/list",
-            "/l",
-            "/file",
-            "/f",
-            "/folder",
-            "/show",
-            "/unload",
-            "/unload-all",
-            "/unload-folder",
-            "/unload-pattern",
-            "/pin",
-            "/unpin",
-            "/context-info",
-            "/fix",
-            "/refactor",
-            "/patch",
-            "/snippet",
-            "/history",
-            "/resume",
-        ]
-
-        if text.startswith("/"):
-            candidates = [c for c in commands if c.startswith(text)]
-        else:
-            # File path completion (basic)
-            candidates = []
-            prefix = text or "."
-            try:
-                basedir = os.path.dirname(prefix) or "."
-                partial = os.path.basename(prefix)
-                for entry in os.listdir(basedir):
-                    full = os.path.join(basedir, entry)
-                    if entry.startswith(partial) or not partial:
-                        candidates.append(
-                            full + "/" if os.path.isdir(full) else full
-                        )
-            except PermissionError:
-                pass
-            candidates.sort()
-
-        try:
-            return candidates[state] if state < len(candidates) else None
-        except IndexError:
-            return None
+        if state == 0:
+            buffer = readline.get_line_buffer()  # type: ignore[union-attr]
+            line = buffer[: readline.get_endidx()]  # type: ignore[union-attr]
+            self._tab_candidates = self._completer.get_completions(line)
+        candidates = self._tab_candidates
+        return candidates[state] if state < len(candidates) else None
 
     # ------------------------------------------------------------------
     # Main loop
@@ -388,6 +392,7 @@ class REPL:
         "/patch":      "_cmd_patch",
     }
     # fmt: on
+    _COMMANDS: tuple[str, ...] = tuple(_COMMAND_MAP)
 
     def _handle_command(self, raw: str) -> None:
         """Dispatch a ``/``-prefixed command.
@@ -420,24 +425,15 @@ class REPL:
     def _handle_chat(self, text: str) -> None:
         """Send a plain-text message to the AI with streaming output.
 
-        Creates a temporary ``SessionManager`` with a Rich-aware display
-        adapter so the response streams token-by-token.
+        Goes through the REPL's streaming ``SessionManager``, whose
+        Rich-aware display adapter renders the response token-by-token.
         """
         print_user_message(text)
 
-        display = _StreamingDisplay()
-        chat_session = SessionManager(
-            provider=self._provider,
-            context=self._context,
-            display=display,
-            temperature=self._config.TEMPERATURE,
-            max_tokens=self._config.MAX_RESPONSE_TOKENS,
-        )
-
         try:
-            response = chat_session.send(text, record_in_history=True)
+            response = self._stream_session.send(text, record_in_history=True)
         except KeyboardInterrupt:
-            display.info("\n[Stream interrupted by user]")
+            self._display.info("\n[Stream interrupted by user]")
             return
 
         if response:
@@ -492,12 +488,20 @@ class REPL:
         self._confirm_and_exit()
 
     def _confirm_and_exit(self) -> None:
-        """Ask for confirmation before exiting (unless force)."""
+        """Ask for confirmation before exiting.
+
+        Exits without asking when stdin is not a terminal, so a piped
+        script's next line is never consumed as the answer, unless
+        ``CONFIRM_FROM_PIPE`` is set.
+        """
         from .output import confirm
 
-        if confirm("\nAre you sure you want to exit?"):
-            self._running = False
-            print_system_message("Goodbye!")
+        if not self._config.CONFIRM_FROM_PIPE and not os.isatty(0):
+            print_system_message("stdin is not a terminal; exiting without asking.")
+        elif not confirm("\nAre you sure you want to exit?"):
+            return
+        self._running = False
+        print_system_message("Goodbye!")
 
     def _cmd_help(self, args: str = "") -> None:
         """Handle ``/help`` or ``/h``."""
@@ -751,19 +755,10 @@ class REPL:
         -------
         The full response text, or ``None`` on interruption / failure.
         """
-        display = _StreamingDisplay()
-        code_session = SessionManager(
-            provider=self._provider,
-            context=self._context,
-            display=display,
-            temperature=self._config.TEMPERATURE,
-            max_tokens=self._config.MAX_RESPONSE_TOKENS,
-        )
-
         try:
-            return code_session.send(prompt, record_in_history=False)
+            return self._stream_session.send(prompt, record_in_history=False)
         except KeyboardInterrupt:
-            display.info("\n[Code operation interrupted by user]")
+            self._display.info("\n[Code operation interrupted by user]")
             return None
 
     def _apply_code_block(self, path: str) -> None:
@@ -787,7 +782,7 @@ class REPL:
             )
             if ok:
                 print_success(msg)
-                self._files.load(path)
+                self._files.update_content(path, new_code)
             else:
                 print_error(msg)
         else:
@@ -2,8 +2,44 @@
 
 from __future__ import annotations
 
+import importlib.util
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Iterator
+from typing import AsyncIterator, Iterator, Optional
+
+import httpx
+
+_shared_client: Optional[httpx.Client] = None
+
+
+def _pool_options() -> dict:
+    """Connection settings shared by the sync and async HTTP clients."""
+    return {
+        "http2": importlib.util.find_spec("h2") is not None,
+        "limits": httpx.Limits(max_keepalive_connections=8),
+        "timeout": httpx.Timeout(600.0, connect=10.0),
+    }
+
+
+def shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client all providers send requests through.
+
+    Sharing one connection pool lets a second provider (or a provider
+    recreated on ``/resume``) reuse warm TLS connections.  HTTP/2 is enabled
+    when the optional ``h2`` package is installed.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(**_pool_options())
+    return _shared_client
+
+
+def async_http_client() -> httpx.AsyncClient:
+    """Return a new async HTTP client with the same pool settings.
+
+    Not shared process-wide: an ``AsyncClient``'s connections belong to the
+    event loop they were opened on, so each owner keeps its own.
+    """
+    return httpx.AsyncClient(**_pool_options())
 
 
 class StreamChunk:
@@ -24,7 +60,10 @@ class ModelProvider(ABC):
         temperature: float,
         max_tokens: int,
     ) -> Iterator[StreamChunk]:
-        """Yield StreamChunk objects for each token as it arrives."""
+        """Yield StreamChunk objects for each token as it arrives.
+
+        Each yielded chunk is a new object; consumers may keep references.
+        """
         ...
 
     @abstractmethod
@@ -42,3 +81,10 @@ class ModelProvider(ABC):
     def name(self) -> str:
         """Human-readable provider name."""
         ...
+
+    def warmup(self) -> None:  # noqa: B027
+        """Best-effort: open a pooled connection before the first request.
+
+        Safe to call from a background thread; must never raise.  The
+        default does nothing.
+        """
@@ -2,16 +2,72 @@
 
 from __future__ import annotations
 
+import json
+import math
 import time
-from typing import Any, AsyncIterator, Iterator
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Union
 
+import httpx
 from openai import APIConnectionError, APIError, AsyncOpenAI, OpenAI, RateLimitError
 
-from .base import ModelProvider, StreamChunk
+from .base import (
+    ModelProvider,
+    StreamChunk,
+    async_http_client,
+    shared_http_client,
+)
+
+_loads: Callable[[Union[bytes, str]], Any]
+try:  # optional native JSON decoder for the per-token SSE events
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - fallback when orjson isn't installed
+    _loads = json.loads
+
+
+# Statuses retried on the raw SSE path (the OpenAI SDK retries the same set)
+_RETRY_STATUSES = frozenset({408, 409, 429})
+# Upper bound on a server-supplied Retry-After delay, in seconds
+_MAX_RETRY_AFTER = 60.0
+
+
+class _RetryableStatus(Exception):
+    """HTTP status from the raw SSE path that should be retried.
+
+    ``retry_after`` is the server's ``Retry-After`` delay in seconds, if any.
+    """
+
+    def __init__(self, detail: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(detail)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    if math.isnan(delay):
+        return None
+    return min(max(delay, 0.0), _MAX_RETRY_AFTER)
 
 
 class NvidiaProvider(ModelProvider):
-    """Provider for NVIDIA AI Foundation Models via OpenAI-compatible endpoint."""
+    """Provider for NVIDIA AI Foundation Models via OpenAI-compatible endpoint.
+
+    Streams by POSTing to ``/chat/completions`` and parsing the
+    ``text/event-stream`` body directly, which skips the OpenAI SDK's
+    per-event model objects.  Pass ``use_sdk=True`` to stream through the
+    OpenAI client instead.
+    """
 
     def __init__(
         self,
@@ -20,45 +76,139 @@ class NvidiaProvider(ModelProvider):
         model: str,
         max_retries: int = 3,
         retry_delay: float = 1.5,
+        use_sdk: bool = False,
     ):
         self._base_url = base_url
         self._api_key = api_key
-        self._client = OpenAI(base_url=base_url, api_key=api_key)
         self._model = model
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        # Backoff schedule and request extras are fixed per provider, so
+        # build them once instead of on every call / retry
+        self._delays = tuple(retry_delay * (1 << i) for i in range(max_retries))
+        self._extra_body = {
+            "chat_template_kwargs": {
+                "enable_thinking": True,
+                "clear_thinking": False,
+            }
+        }
+        self._use_sdk = use_sdk
+        self._http = shared_http_client()
+        self._client: Optional[OpenAI] = (
+            OpenAI(base_url=base_url, api_key=api_key, http_client=self._http)
+            if use_sdk
+            else None
+        )
+        # The shared client carries no base URL or auth, so set them per request
+        self._completions_url = base_url.rstrip("/") + "/chat/completions"
+        self._sse_headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "text/event-stream",
+        }
 
     @property
     def name(self) -> str:
         return f"nvidia:{self._model}"
 
+    def warmup(self) -> None:
+        """Resolve DNS and complete the TLS handshake on the shared pool.
+
+        Any response (even 404) leaves a keep-alive connection behind for
+        the first real request; failures surface there instead.
+        """
+        try:
+            self._http.head(self._base_url, timeout=5.0)
+        except Exception:  # runs in a daemon thread: must never raise
+            pass
+
     def stream(
         self,
         messages: list[dict],
         temperature: float,
         max_tokens: int,
     ) -> Iterator[StreamChunk]:
+        if self._use_sdk:
+            yield from self._stream_sdk(messages, temperature, max_tokens)
+        else:
+            yield from self._stream_sse(messages, temperature, max_tokens)
+
+    def _stream_sse(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> Iterator[StreamChunk]:
+        payload = {
+            "model": self._model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+            **self._extra_body,
+        }
+        last_exc: Exception | None = None
+        for attempt, wait in enumerate(self._delays):
+            started = False
+            try:
+                with self._http.stream(
+                    "POST",
+                    self._completions_url,
+                    json=payload,
+                    headers=self._sse_headers,
+                ) as response:
+                    status = response.status_code
+                    if status >= 400:
+                        response.read()
+                        detail = f"HTTP {status}: {response.text[:500]}"
+                        if status >= 500 or status in _RETRY_STATUSES:
+                            raise _RetryableStatus(
+                                detail,
+                                _parse_retry_after(response.headers.get("retry-after")),
+                            )
+                        raise RuntimeError(f"API error: {detail}")
+                    lines = self._split_lines(response.iter_bytes())
+                    for chunk in self._parse_sse(lines):
+                        started = True
+                        yield chunk
+                return
+            except (httpx.TransportError, _RetryableStatus) as e:
+                if started:
+                    # Retrying would replay tokens the caller already shown
+                    raise RuntimeError(f"Stream interrupted: {e}") from e
+                last_exc = e
+                if isinstance(e, _RetryableStatus) and e.retry_after is not None:
+                    wait = e.retry_after
+                print(
+                    f"\n[Retry {attempt + 1}/{self._max_retries}] {e}. "
+                    f"Waiting {wait:.1f}s…"
+                )
+                time.sleep(wait)
+        raise RuntimeError(
+            f"All {self._max_retries} retries failed: {last_exc}"
+        ) from last_exc
+
+    def _stream_sdk(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> Iterator[StreamChunk]:
+        assert self._client is not None
         last_exc: Exception | None = None
-        for attempt in range(self._max_retries):
+        for attempt, wait in enumerate(self._delays):
             try:
                 completion = self._client.chat.completions.create(
                     model=self._model,
                     messages=messages,  # type: ignore
                     temperature=temperature,
                     max_tokens=max_tokens,
-                    extra_body={
-                        "chat_template_kwargs": {
-                            "enable_thinking": True,
-                            "clear_thinking": False,
-                        }
-                    },
+                    extra_body=self._extra_body,
                     stream=True,
                 )
                 yield from self._parse_stream(completion)
                 return
             except (APIConnectionError, RateLimitError) as e:
                 last_exc = e
-                wait = self._retry_delay * (2**attempt)
                 print(
                     f"\n[Retry {attempt + 1}/{self._max_retries}] {e}. "
                     f"Waiting {wait:.1f}s…"
@@ -72,11 +222,12 @@ class NvidiaProvider(ModelProvider):
 
     @property
     def _async_client(self) -> AsyncOpenAI:
-        """Lazily create an async OpenAI client."""
+        """Lazily create an async OpenAI client (one keep-alive pool per provider)."""
         if not hasattr(self, "_async_openai_client"):
             self._async_openai_client = AsyncOpenAI(
                 base_url=self._base_url,
                 api_key=self._api_key,
+                http_client=async_http_client(),
             )
         return self._async_openai_client
 
@@ -89,7 +240,8 @@ class NvidiaProvider(ModelProvider):
         """Async version of stream for Textual Workers."""
         import asyncio
 
-        for attempt in range(self._max_retries):
+        last = len(self._delays) - 1
+        for attempt, delay in enumerate(self._delays):
             try:
                 response = await self._async_client.chat.completions.create(
                     model=self._model,
@@ -111,21 +263,75 @@ class NvidiaProvider(ModelProvider):
                         yield StreamChunk(content=content, reasoning=reasoning)
                 return
             except Exception:
-                if attempt < self._max_retries - 1:
-                    delay = self._retry_delay * (2**attempt)
+                if attempt < last:
                     await asyncio.sleep(delay)
                 else:
                     raise
 
     @staticmethod
     def _parse_stream(completion: Any) -> Iterator[StreamChunk]:
+        # Hot loop: bind getattr locally
+        _getattr = getattr
         for chunk in completion:
-            if not getattr(chunk, "choices", None):
+            choices = _getattr(chunk, "choices", None)
+            if not choices:
+                continue
+            delta = _getattr(choices[0], "delta", None)
+            if delta is None:
+                continue
+            reasoning = _getattr(delta, "reasoning_content", None) or ""
+            content = _getattr(delta, "content", None) or ""
+            if reasoning or content:
+                yield StreamChunk(content, reasoning)
+
+    @staticmethod
+    def _split_lines(blocks: Iterable[bytes]) -> Iterator[bytes]:
+        """Split a body streamed as byte blocks into ``\n``-delimited lines.
+
+        Works on the undecoded bytes (``\r`` is left for the caller's
+        ``strip``), so no per-line ``str`` is built for the transport framing.
+        """
+        pending = b""
+        for block in blocks:
+            if pending:
+                block = pending + block
+            lines = block.split(b"\n")
+            pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+    @staticmethod
+    def _parse_sse(lines: Iterable[bytes]) -> Iterator[StreamChunk]:
+        """Decode OpenAI-style ``data: {...}`` event lines into chunks.
+
+        The JSON payload goes to the decoder as bytes; only the decoded
+        ``content`` / ``reasoning_content`` strings are ever materialized.
+        """
+        loads = _loads
+        for line in lines:
+            # Skip blank separators, ": keep-alive" comments and event: lines
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if not data:
+                continue
+            if data == b"[DONE]":
+                return
+            try:
+                event = loads(data)
+            except ValueError as e:  # orjson.JSONDecodeError subclasses it
+                snippet = data[:200].decode("utf-8", "replace")
+                raise RuntimeError(f"Malformed stream event: {snippet}") from e
+            choices = event.get("choices")
+            if not choices:
+                if event.get("error"):
+                    raise RuntimeError(f"API error: {event['error']}")
                 continue
-            if not chunk.choices or getattr(chunk.choices[0], "delta", None) is None:
+            delta = choices[0].get("delta")
+            if not delta:
                 continue
-            delta = chunk.choices[0].delta
-            reasoning = getattr(delta, "reasoning_content", None) or ""
-            content = getattr(delta, "content", None) or ""
+            reasoning = delta.get("reasoning_content") or ""
+            content = delta.get("content") or ""
             if reasoning or content:
-                yield StreamChunk(content=content, reasoning=reasoning)
+                yield StreamChunk(content, reasoning)
@@ -6,7 +6,7 @@ from typing import Iterator
 
 from openai import OpenAI
 
-from .base import ModelProvider, StreamChunk
+from .base import ModelProvider, StreamChunk, shared_http_client
 
 
 class OllamaProvider(ModelProvider):
@@ -16,7 +16,9 @@ class OllamaProvider(ModelProvider):
     """
 
     def __init__(self, model: str, base_url: str = "http://localhost:11434/v1"):
-        self._client = OpenAI(base_url=base_url, api_key="ollama")
+        self._client = OpenAI(
+            base_url=base_url, api_key="ollama", http_client=shared_http_client()
+        )
         self._model = model
 
     @property
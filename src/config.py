@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -15,48 +16,53 @@ from dotenv import load_dotenv
 ROOT_DIR = Path(__file__).resolve().parent.parent
 ENV_PATH = ROOT_DIR / ".env.local"
 
-# Load the specific file
-load_dotenv(dotenv_path=ENV_PATH)
+# Load the specific file once per process (re-imports skip the disk read)
+if not os.environ.get("_PATCHPILOT_ENV_LOADED"):
+    load_dotenv(dotenv_path=ENV_PATH)
+    os.environ["_PATCHPILOT_ENV_LOADED"] = "1"
 
 
-class Config:
-    # Provider
-    BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://integrate.api.nvidia.com/v1")
-    API_KEY: str = os.getenv("OPENAI_API_KEY", "")
-    MODEL: str = os.getenv("AI_MODEL", "z-ai/glm4.7")
-
+def _env_int(name: str, default: int) -> int:
     try:
-        TEMPERATURE: float = float(os.getenv("AI_TEMPERATURE", "0.4"))
+        return int(os.getenv(name, str(default)))
     except (ValueError, TypeError):
-        TEMPERATURE: float = 0.4
+        return default
 
-    # File loading settings
-    try:
-        MAX_FILES: int = int(os.getenv("MAX_FILES", "12"))
-    except (ValueError, TypeError):
-        MAX_FILES: int = 12
 
+def _env_float(name: str, default: float) -> float:
     try:
-        MAX_FILE_TOKENS: int = int(os.getenv("MAX_FILE_TOKENS", "1500"))
+        return float(os.getenv(name, str(default)))
     except (ValueError, TypeError):
-        MAX_FILE_TOKENS: int = 1500
+        return default
 
-    try:
-        MAX_TOTAL_TOKENS: int = int(os.getenv("MAX_TOTAL_TOKENS", "4500"))
-    except (ValueError, TypeError):
-        MAX_TOTAL_TOKENS: int = 4500
 
-    try:
-        MAX_CONVO_MESSAGES: int = int(os.getenv("MAX_CONVO_MESSAGES", "40"))
-    except (ValueError, TypeError):
-        MAX_CONVO_MESSAGES: int = 40
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, "true" if default else "false").lower() == "true"
 
-    try:
-        MAX_RESPONSE_TOKENS: int = int(os.getenv("MAX_RESPONSE_TOKENS", "4096"))
-    except (ValueError, TypeError):
-        MAX_RESPONSE_TOKENS: int = 4096
 
-    DEFAULT_EXTENSIONS: list[str] = [
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Settings resolved from the environment once, at import time.
+
+    Instances are immutable; use :func:`dataclasses.replace` to override a
+    value (e.g. ``--model``).  Fields are slots, so read them from an
+    instance (``Config().API_KEY``), not from the class.
+    """
+
+    # Provider
+    BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://integrate.api.nvidia.com/v1")
+    API_KEY: str = os.getenv("OPENAI_API_KEY", "").strip()
+    MODEL: str = os.getenv("AI_MODEL", "z-ai/glm4.7")
+    TEMPERATURE: float = _env_float("AI_TEMPERATURE", 0.4)
+
+    # File loading settings
+    MAX_FILES: int = _env_int("MAX_FILES", 12)
+    MAX_FILE_TOKENS: int = _env_int("MAX_FILE_TOKENS", 1500)
+    MAX_TOTAL_TOKENS: int = _env_int("MAX_TOTAL_TOKENS", 4500)
+    MAX_CONVO_MESSAGES: int = _env_int("MAX_CONVO_MESSAGES", 40)
+    MAX_RESPONSE_TOKENS: int = _env_int("MAX_RESPONSE_TOKENS", 4096)
+
+    DEFAULT_EXTENSIONS: tuple[str, ...] = (
         "*.ts",
         "*.js",
         "*.css",
@@ -65,24 +71,19 @@ class Config:
         "*.py",
         "*.txt",
         "*.md",
-    ]
-
-    # Safety & Retry
-    ENABLE_SYNTAX_VALIDATION: bool = (
-        os.getenv("ENABLE_SYNTAX_VALIDATION", "false").lower() == "true"
     )
-    BACKUP_ON_WRITE: bool = os.getenv("BACKUP_ON_WRITE", "true").lower() == "true"
-    DIFF_PREVIEW: bool = os.getenv("DIFF_PREVIEW", "true").lower() == "true"
 
-    try:
-        MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
-    except (ValueError, TypeError):
-        MAX_RETRIES: int = 3
+    # Safety & Retry
+    ENABLE_SYNTAX_VALIDATION: bool = _env_bool("ENABLE_SYNTAX_VALIDATION", False)
+    BACKUP_ON_WRITE: bool = _env_bool("BACKUP_ON_WRITE", True)
+    DIFF_PREVIEW: bool = _env_bool("DIFF_PREVIEW", True)
+    MAX_RETRIES: int = _env_int("MAX_RETRIES", 3)
+    RETRY_DELAY: float = _env_float("RETRY_DELAY", 1.5)
+    # Answer y/N prompts from a piped stdin instead of declining them
+    CONFIRM_FROM_PIPE: bool = _env_bool("CONFIRM_FROM_PIPE", False)
 
-    try:
-        RETRY_DELAY: float = float(os.getenv("RETRY_DELAY", "1.5"))
-    except (ValueError, TypeError):
-        RETRY_DELAY: float = 1.5
+    # Stream through the OpenAI SDK instead of the built-in SSE parser
+    STREAM_VIA_SDK: bool = _env_bool("STREAM_VIA_SDK", False)
 
     SYSTEM_PROMPT: str = (
         "You are a helpful AI assistant that can read, understand, and edit "
@@ -99,5 +100,5 @@ class Config:
 
 logger = logging.getLogger(__name__)
 
-if not Config.API_KEY:
+if not Config().API_KEY:
     logger.warning("API_KEY not found at %s", ENV_PATH)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from .manager import ContextManager, Message
+from .manager import ContextManager, FileEntry, Message
 
 __all__ = [
     "ContextManager",
+    "FileEntry",
     "Message",
 ]
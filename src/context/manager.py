@@ -2,24 +2,54 @@
 
 from __future__ import annotations
 
-import os
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Optional, TypedDict
 
+from ..paths import abspath
+
+# First line of every file message is ``_TAG_PREFIX + path``
+_TAG_PREFIX = "[PROJECT_FILE] "
+# Inserted between the head and tail of a file that exceeds its budget
+_TRUNC_MARKER = "\n\n/* ...TRUNCATED... (tail follows) */\n\n"
+
 
 @dataclass
 class Message:
     role: str
     content: str
+    # Computed once from ``content``; messages are not mutated after creation
+    tokens: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Rough estimate: 1 token ≈ 4 chars
+        self.tokens = max(1, len(self.content) // 4)
 
     def token_estimate(self) -> int:
-        """Rough estimate: 1 token ≈ 4 chars."""
-        return max(1, len(self.content) // 4)
+        """Rough estimate: 1 token ≈ 4 chars (cached in :attr:`tokens`)."""
+        return self.tokens
 
     def to_dict(self) -> dict:
         return {"role": self.role, "content": self.content}
 
 
+@dataclass
+class FileEntry:
+    """A loaded file: its tag line, raw content and budgeted context message."""
+
+    __slots__ = ("tag", "raw", "message")
+
+    tag: str
+    raw: str
+    message: Message
+
+    @property
+    def tokens(self) -> int:
+        return self.message.tokens
+
+
 class FileStats(TypedDict):
     path: str
     tokens: int
@@ -45,6 +75,27 @@ class ContextManager:
     Applies a token budget to keep total context within limits.
     """
 
+    __slots__ = (
+        "_system",
+        "_max_total",
+        "_max_file_tokens",
+        "_max_file_chars",
+        "_file_half",
+        "_max_convo",
+        "_file_messages",
+        "_convo_messages",
+        "_convo_dicts",
+        "_pinned_files",
+        "_file_tokens_sum",
+        "_convo_tokens_sum",
+        "_convo_prefix",
+        "_convo_start",
+        "_convo_cum",
+        "_prefix_messages",
+        "_prefix_dirty",
+        "_messages",
+    )
+
     def __init__(
         self,
         system_prompt: str,
@@ -55,130 +106,208 @@ class ContextManager:
         self._system = Message("system", system_prompt)
         self._max_total = max_total_tokens
         self._max_file_tokens = max_file_tokens
+        # Character limits for _apply_file_budget (1 token ≈ 4 chars)
+        self._max_file_chars = max_file_tokens * 4
+        self._file_half = self._max_file_chars // 2
         self._max_convo = max_convo_messages
-        self._file_messages: list[Message] = []
-        self._convo_messages: list[Message] = []
+        # path -> loaded file entry, in load order
+        self._file_messages: dict[str, FileEntry] = {}
+        # Rolling window, bounded to max_convo_messages in _append_convo
+        self._convo_messages: deque[Message] = deque()
+        # Serialized form of each convo message, in step with _convo_messages
+        self._convo_dicts: deque[dict] = deque()
         self._pinned_files: set[str] = set()
+        # Running token totals, kept in step with the two layers above
+        self._file_tokens_sum: int = 0
+        self._convo_tokens_sum: int = 0
+        # Cumulative convo tokens (since the last reset) at each message; the
+        # live entries are _convo_prefix[_convo_start:], in step with
+        # _convo_messages.  A list (not a deque) so build_messages can bisect
+        # it with O(1) indexing; evicted entries are compacted in batches.
+        self._convo_prefix: list[int] = []
+        self._convo_start: int = 0
+        self._convo_cum: int = 0
+        # Serialized system + file messages, reused across turns so the
+        # request prefix stays identical until a file is loaded or removed
+        self._prefix_messages: list[dict] = []
+        self._prefix_dirty: bool = True
+        # Last build_messages() result; None once any layer changes
+        self._messages: Optional[list[dict]] = None
 
     # ------------------------------------------------------------------
     # File layer
     # ------------------------------------------------------------------
 
     def upsert_file(self, path: str, content: str) -> None:
-        tag = f"[PROJECT_FILE] {path}"
-        # Remove existing entry for this path
-        self._file_messages = [
-            m for m in self._file_messages if not m.content.startswith(tag + "\n")
-        ]
-        budgeted = self._apply_file_budget(content)
-        self._file_messages.append(Message("user", f"{tag}\n{budgeted}"))
+        # Drop any existing entry first so a reloaded file moves to the end
+        old = self._file_messages.pop(path, None)
+        if old is not None:
+            self._file_tokens_sum -= old.tokens
+        tag = _TAG_PREFIX + path
+        msg = Message("user", f"{tag}\n{self._apply_file_budget(content)}")
+        self._file_messages[path] = FileEntry(tag, content, msg)
+        self._file_tokens_sum += msg.tokens
+        self._prefix_dirty = True
+        self._messages = None
 
     def remove_file(self, path: str, force: bool = False) -> bool:
         """
         Remove a file from context.
         Returns True if removed, False if skipped (e.g. pinned).
         """
-        path = os.path.abspath(path)
+        path = abspath(path)
         if path in self._pinned_files and not force:
             return False
 
-        tag = f"[PROJECT_FILE] {path}"
-        self._file_messages = [
-            m for m in self._file_messages if not m.content.startswith(tag + "\n")
-        ]
+        old = self._file_messages.pop(path, None)
+        if old is not None:
+            self._file_tokens_sum -= old.tokens
+            self._prefix_dirty = True
+            self._messages = None
         self._pinned_files.discard(path)
         return True
 
-    def _apply_file_budget(self, content: str) -> str:
-        """Chunk content to fit within per-file token budget."""
-        max_chars = self._max_file_tokens * 4
+    def _apply_file_budget(self, content: str, max_tokens: Optional[int] = None) -> str:
+        """Chunk content to fit within a per-file token budget.
+
+        *max_tokens* defaults to the configured ``max_file_tokens``.
+        """
+        if max_tokens is None:
+            max_chars, half = self._max_file_chars, self._file_half
+        else:
+            max_chars = max_tokens * 4
+            half = max_chars // 2
         if len(content) <= max_chars:
             return content
-        half = max_chars // 2
-        head = content[:half]
-        tail = content[-(half - 100) :]
-        return head + "\n\n/* ...TRUNCATED... (tail follows) */\n\n" + tail
+        tail = content[-(half - 100) :] if half > 100 else ""
+        return "".join((content[:half], _TRUNC_MARKER, tail))
 
     # ------------------------------------------------------------------
     # Conversation layer
     # ------------------------------------------------------------------
 
     def add_user(self, content: str) -> None:
-        self._convo_messages.append(Message("user", content))
-        self._trim_convo()
+        self._append_convo(Message("user", content))
 
     def add_assistant(self, content: str) -> None:
-        self._convo_messages.append(Message("assistant", content))
-        self._trim_convo()
-
-    def _trim_convo(self) -> None:
-        if len(self._convo_messages) > self._max_convo:
-            self._convo_messages = self._convo_messages[-self._max_convo :]
+        self._append_convo(Message("assistant", content))
+
+    def _append_convo(self, msg: Message) -> None:
+        self._messages = None
+        convo = self._convo_messages
+        convo.append(msg)
+        self._convo_dicts.append(msg.to_dict())
+        self._convo_tokens_sum += msg.tokens
+        self._convo_cum += msg.tokens
+        self._convo_prefix.append(self._convo_cum)
+        # Evict by hand (not deque maxlen) so the running sum stays exact
+        while len(convo) > self._max_convo:
+            self._convo_tokens_sum -= convo.popleft().tokens
+            self._convo_dicts.popleft()
+            self._convo_start += 1
+        # Drop evicted prefix entries once they outnumber the live ones
+        if self._convo_start > len(convo):
+            del self._convo_prefix[: self._convo_start]
+            self._convo_start = 0
 
     def reset_convo(self) -> None:
+        self._messages = None
         self._convo_messages.clear()
+        self._convo_dicts.clear()
+        self._convo_prefix.clear()
+        self._convo_start = 0
+        self._convo_tokens_sum = 0
+        self._convo_cum = 0
 
     # ------------------------------------------------------------------
     # Build final message list with total-token enforcement
     # ------------------------------------------------------------------
 
-    def build_messages(
-        self, ephemeral_user_content: Optional[str] = None
-    ) -> list[dict]:
+    def build_messages(self) -> list[dict]:
         """
-        Assembles: system + files + convo + optional ephemeral user message.
+        Assembles: system + files + convo.
         Drops oldest convo messages if total token budget is exceeded.
         Falls back to shrinking file content if still over budget.
+
+        The result is cached until a file or convo message changes, and the
+        same list is returned each time: callers must not mutate it.
         """
-        ephemeral = (
-            [Message("user", ephemeral_user_content)] if ephemeral_user_content else []
-        )
+        if self._messages is None:
+            self._messages = self._assemble(None)
+        return self._messages
 
-        def total_tokens(convo: list[Message]) -> int:
-            return (
-                self._system.token_estimate()
-                + sum(m.token_estimate() for m in self._file_messages)
-                + sum(m.token_estimate() for m in convo)
-                + sum(m.token_estimate() for m in ephemeral)
-            )
+    def build_messages_with_ephemeral(self, content: str) -> list[dict]:
+        """Like :meth:`build_messages`, plus *content* as a trailing user
+        message that is not recorded in the conversation.
 
-        convo = list(self._convo_messages)
-        # Drop oldest convo messages until within budget
-        while total_tokens(convo) > self._max_total and convo:
-            convo.pop(0)
-
-        # If still over, compress file messages
-        file_msgs = list(self._file_messages)
-        if total_tokens(convo) > self._max_total:
-            file_msgs = [
-                Message(
-                    m.role,
-                    self._apply_file_budget(m.content[: self._max_file_tokens * 2]),
-                )
-                for m in file_msgs
+        Returns a new list.  An empty *content* adds nothing.
+        """
+        if not content:
+            return self.build_messages()
+        ephemeral = Message("user", content)
+        if self.estimated_total_tokens() + ephemeral.tokens <= self._max_total:
+            # Fits without trimming, so the cached list is the exact prefix
+            return [*self.build_messages(), ephemeral.to_dict()]
+        return self._assemble(ephemeral)
+
+    def _assemble(self, ephemeral: Optional[Message]) -> list[dict]:
+        fixed = self._system.tokens + self._file_tokens_sum
+        if ephemeral is not None:
+            fixed += ephemeral.tokens
+        convo_sum = self._convo_tokens_sum
+        overflow = fixed + convo_sum - self._max_total
+
+        # Drop the fewest oldest convo messages whose tokens cover the
+        # overflow: one bisect over the cumulative sums, then one slice
+        msgs = self._convo_messages
+        drop = 0
+        if overflow > 0 and msgs:
+            prefix, start = self._convo_prefix, self._convo_start
+            base = prefix[start] - msgs[0].tokens
+            drop = min(
+                bisect_left(prefix, base + overflow, start) - start + 1, len(msgs)
+            )
+            convo_sum -= prefix[start + drop - 1] - base
+
+        # If still over, re-budget file content from the raw text at half the
+        # per-file limit; entries already under that cap are reused as-is
+        if fixed + convo_sum > self._max_total:
+            cap = self._max_file_tokens // 2
+            result = [self._system.to_dict()]
+            for e in self._file_messages.values():
+                if e.message.tokens > cap:
+                    body = self._apply_file_budget(e.raw, cap)
+                    result.append({"role": "user", "content": f"{e.tag}\n{body}"})
+                else:
+                    result.append(e.message.to_dict())
+        else:
+            result = self._prefix()[:]
+
+        convo_dicts = self._convo_dicts
+        result.extend(islice(convo_dicts, drop, None) if drop else convo_dicts)
+        if ephemeral is not None:
+            result.append(ephemeral.to_dict())
+        return result
+
+    def _prefix(self) -> list[dict]:
+        """Return the cached system + file dicts, rebuilding them if stale."""
+        if self._prefix_dirty:
+            self._prefix_messages = [
+                self._system.to_dict(),
+                *(e.message.to_dict() for e in self._file_messages.values()),
             ]
-
-        all_messages = [self._system, *file_msgs, *convo, *ephemeral]
-        return [m.to_dict() for m in all_messages]
+            self._prefix_dirty = False
+        return self._prefix_messages
 
     # ------------------------------------------------------------------
     # Inspection
     # ------------------------------------------------------------------
 
     def file_paths(self) -> list[str]:
-        paths = []
-        for m in self._file_messages:
-            first_line = m.content.split("\n", 1)[0]
-            if first_line.startswith("[PROJECT_FILE] "):
-                paths.append(first_line[len("[PROJECT_FILE] ") :])
-        return paths
+        return list(self._file_messages)
 
     def estimated_total_tokens(self) -> int:
-        return (
-            self._system.token_estimate()
-            + sum(m.token_estimate() for m in self._file_messages)
-            + sum(m.token_estimate() for m in self._convo_messages)
-        )
+        return self._system.tokens + self._file_tokens_sum + self._convo_tokens_sum
 
     # ------------------------------------------------------------------
     # Pinning and Stats
@@ -186,31 +315,28 @@ class ContextManager:
 
     def pin_file(self, path: str) -> bool:
         """Mark a file as pinned. File must be loaded first."""
-        path = os.path.abspath(path)
-        if any(
-            m.content.startswith(f"[PROJECT_FILE] {path}\n")
-            for m in self._file_messages
-        ):
+        path = abspath(path)
+        if path in self._file_messages:
             self._pinned_files.add(path)
             return True
         return False
 
     def unpin_file(self, path: str) -> None:
-        path = os.path.abspath(path)
+        path = abspath(path)
         self._pinned_files.discard(path)
 
     def is_pinned(self, path: str) -> bool:
-        return os.path.abspath(path) in self._pinned_files
+        return abspath(path) in self._pinned_files
 
     @property
     def file_tokens(self) -> int:
         """Total tokens used by loaded files."""
-        return sum(m.token_estimate() for m in self._file_messages)
+        return self._file_tokens_sum
 
     @property
     def convo_tokens(self) -> int:
         """Total tokens used by conversation messages."""
-        return sum(m.token_estimate() for m in self._convo_messages)
+        return self._convo_tokens_sum
 
     @property
     def max_file_tokens(self) -> int:
@@ -218,18 +344,10 @@ class ContextManager:
         return self._max_file_tokens
 
     def get_stats(self) -> ContextStats:
-        file_stats = []
-        for m in self._file_messages:
-            tag = "[PROJECT_FILE] "
-            if m.content.startswith(tag):
-                path = m.content.split("\n", 1)[0][len(tag) :]
-                file_stats.append(
-                    FileStats(
-                        path=path,
-                        tokens=m.token_estimate(),
-                        pinned=path in self._pinned_files,
-                    )
-                )
+        file_stats = [
+            FileStats(path=path, tokens=m.tokens, pinned=path in self._pinned_files)
+            for path, m in self._file_messages.items()
+        ]
 
         return ContextStats(
             total_tokens=self.estimated_total_tokens(),
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-import glob
-import mimetypes
+import fnmatch
+import functools
+import heapq
 import os
-from typing import ClassVar, Optional
+import re
+from typing import Callable, ClassVar, Optional, Sequence
 
 from ..context.manager import ContextManager
+from ..paths import abspath
 from .readers import FileReaders
 
+ReadResult = tuple[Optional[str], Optional[str]]
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a (normcased) glob into a reusable regex."""
+    return re.compile(fnmatch.translate(pattern))
+
 
 class FileManager:
     """
@@ -18,6 +29,8 @@ class FileManager:
     Delegates context injection to ContextManager and reading to FileReaders.
     """
 
+    __slots__ = ("_ctx", "_max_files", "_extensions", "_store", "_version")
+
     FILE_READERS: ClassVar[dict[str, str]] = {
         ".pdf": "read_pdf",
         ".docx": "read_word",
@@ -36,6 +49,10 @@ class FileManager:
         ".pptx": "read_powerpoint",
         ".ppt": "read_powerpoint",
     }
+    # Extension -> reader function, resolved once at class creation
+    _READER_FNS: ClassVar[dict[str, Callable[[str], ReadResult]]] = {
+        ext: getattr(FileReaders, name) for ext, name in FILE_READERS.items()
+    }
 
     TEXT_EXTENSIONS: ClassVar[set[str]] = {
         ".md",
@@ -50,16 +67,18 @@ class FileManager:
     }
 
     def __init__(
-        self, context: ContextManager, max_files: int, default_extensions: list[str]
+        self,
+        context: ContextManager,
+        max_files: int,
+        default_extensions: Sequence[str],
     ):
         self._ctx = context
         self._max_files = max_files
         self._extensions = default_extensions
         # path -> full raw content (for patch generation etc.)
         self._store: dict[str, str] = {}
-
-        # Initialize mimetypes
-        mimetypes.init()
+        # Bumped whenever the set of loaded paths may have changed
+        self._version: int = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -67,24 +86,43 @@ class FileManager:
 
     def load(self, path: str) -> tuple[bool, Optional[str]]:
         """Load a single file. Returns (success, error_message)."""
-        path = os.path.abspath(path)
+        path = abspath(path)
         content, err = self._read(path)
         if err:
             return False, err
         if content is None:
             return False, "No content read from file"
         self._store[path] = content
+        self._version += 1
         self._ctx.upsert_file(path, content)
         return True, None
 
+    def update_content(self, path: str, content: str) -> None:
+        """Replace a file's stored content with text just written to disk.
+
+        Used after a successful patch so the file is not read back from
+        disk.  Formats with a dedicated reader (PDF, JSON, HTML, ...) store
+        extracted text rather than the raw bytes, so those are re-read via
+        :meth:`load` instead.
+        """
+        path = abspath(path)
+        if os.path.splitext(path)[1].lower() in self.FILE_READERS:
+            self.load(path)
+            return
+        if path not in self._store:
+            self._version += 1
+        self._store[path] = content
+        self._ctx.upsert_file(path, content)
+
     def unload(self, path: str, force: bool = False) -> bool:
         """
         Unload a single file.
         Returns True if successful, False if skipped (e.g. pinned).
         """
-        path = os.path.abspath(path)
+        path = abspath(path)
         if self._ctx.remove_file(path, force=force):
             self._store.pop(path, None)
+            self._version += 1
             return True
         return False
 
@@ -99,7 +137,7 @@ class FileManager:
 
     def unload_folder(self, folder: str) -> int:
         """Unload all files within a folder."""
-        folder = os.path.abspath(folder)
+        folder = abspath(folder)
         paths = list(self._store.keys())
         count = 0
         for p in paths:
@@ -109,15 +147,13 @@ class FileManager:
         return count
 
     def unload_pattern(self, pattern: str) -> int:
-        """Unload files matching a glob pattern."""
-        import fnmatch
-
-        paths = list(self._store.keys())
+        """Unload files whose basename or full path matches a glob pattern."""
+        match = _compile_glob(os.path.normcase(pattern)).match
+        normcase = os.path.normcase
         count = 0
-        for p in paths:
-            if fnmatch.fnmatch(os.path.basename(p), pattern) or fnmatch.fnmatch(
-                p, pattern
-            ):
+        for p in list(self._store.keys()):
+            name = normcase(p)
+            if match(os.path.basename(name)) or match(name):
                 if self.unload(p):
                     count += 1
         return count
@@ -145,30 +181,68 @@ class FileManager:
         return loaded, errors
 
     def get_content(self, path: str) -> Optional[str]:
-        return self._store.get(os.path.abspath(path))
+        return self._store.get(abspath(path))
 
     def loaded_paths(self) -> list[str]:
         return list(self._store.keys())
 
+    @property
+    def version(self) -> int:
+        """Change token for :meth:`loaded_paths`; bumped on every load/unload."""
+        return self._version
+
     def is_loaded(self, path: str) -> bool:
-        return os.path.abspath(path) in self._store
+        return abspath(path) in self._store
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _discover(self, folder: str, extensions: list[str]) -> list[str]:
-        files: list[str] = []
+    def _discover(self, folder: str, extensions: Sequence[str]) -> list[str]:
+        """Return the first ``max_files`` matching paths under *folder*.
+
+        Walks the tree once with :func:`os.scandir`, matching each file name
+        against every pattern.  Like the ``glob("**/<pattern>")`` calls this
+        replaces, hidden files and directories are skipped.  Symlinked
+        directories are not followed.
+        """
+        normcase = os.path.normcase
+        # "*.py"-style patterns become a suffix test; anything else is a glob
+        suffixes: list[str] = []
+        globs = []
         for ext in extensions:
-            files.extend(glob.glob(os.path.join(folder, "**", ext), recursive=True))
-        seen: set[str] = set()
-        unique: list[str] = []
-        for f in sorted(files):
-            af = os.path.abspath(f)
-            if af not in seen:
-                seen.add(af)
-                unique.append(af)
-        return unique[: self._max_files]
+            ext = normcase(ext)
+            tail = ext[1:]
+            if ext.startswith("*") and not any(c in tail for c in "*?["):
+                suffixes.append(tail)
+            else:
+                globs.append(_compile_glob(ext).match)
+        suffix_tuple = tuple(suffixes)
+
+        found: list[str] = []
+        stack = [abspath(folder)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                key = normcase(name)
+                if (suffix_tuple and key.endswith(suffix_tuple)) or any(
+                    match(key) for match in globs
+                ):
+                    found.append(entry.path)
+        return heapq.nsmallest(self._max_files, found)
 
     def _read(self, path: str) -> tuple[Optional[str], Optional[str]]:
         """
@@ -180,16 +254,8 @@ class FileManager:
             return None, "File not found."
 
         try:
-            _, ext = os.path.splitext(path)
-            ext = ext.lower()
-
-            reader_name = self.FILE_READERS.get(ext)
-            if reader_name:
-                reader_fn = getattr(FileReaders, reader_name, None)
-                if reader_fn:
-                    return reader_fn(path)  # type: ignore[no-any-return]
-
-            return FileReaders.read_text(path)
+            ext = os.path.splitext(path)[1].lower()
+            return self._READER_FNS.get(ext, FileReaders.read_text)(path)
 
         except Exception as exc:
             return None, f"Read error: {exc}"
@@ -6,10 +6,19 @@ import difflib
 import os
 import re
 import shutil
+import sys
 import tempfile
 import time
 from typing import Optional
 
+from ..paths import abspath
+
+# First fenced code block in a model response (optional language tag)
+_FENCE_RE = re.compile(r"```(?:\w+)?\n(.*?)```", re.DOTALL)
+
+# ANSI colour for added / removed lines in the diff preview
+_DIFF_COLOURS = {"+": "\033[32m", "-": "\033[31m"}
+
 
 class PatchManager:
     """
@@ -20,13 +29,31 @@ class PatchManager:
     4. Atomic write (temp file + rename)
     """
 
+    __slots__ = (
+        "_backup",
+        "_diff_preview",
+        "_backup_count",
+        "_backup_dir",
+        "_durable",
+        "_confirm_from_pipe",
+    )
+
     def __init__(
-        self, backup: bool = True, diff_preview: bool = True, backup_count: int = 5
+        self,
+        backup: bool = True,
+        diff_preview: bool = True,
+        backup_count: int = 5,
+        durable: bool = False,
+        confirm_from_pipe: bool = False,
     ):
         self._backup = backup
         self._diff_preview = diff_preview
         self._backup_count = backup_count
+        # fsync the file and its directory on write (off by default: slower)
+        self._durable = durable
         self._backup_dir = "backups"
+        # Read the y/N answer from stdin even when it is not a terminal
+        self._confirm_from_pipe = confirm_from_pipe
 
     # ------------------------------------------------------------------
     # Public API
@@ -37,8 +64,7 @@ class PatchManager:
         Pull the first fenced code block out of a model response.
         Returns the inner text or None if not found.
         """
-        pattern = r"```(?:\w+)?\n(.*?)```"
-        match = re.search(pattern, model_response, re.DOTALL)
+        match = _FENCE_RE.search(model_response)
         return match.group(1).rstrip("\n") if match else None
 
     def apply(
@@ -48,7 +74,7 @@ class PatchManager:
         Write new_content to path safely.
         Returns (success, message).
         """
-        path = os.path.abspath(path)
+        path = abspath(path)
         old_content = self._read(path)
 
         if self._diff_preview:
@@ -58,6 +84,12 @@ class PatchManager:
             return True, "[DRY-RUN] No changes applied."
 
         if confirm:
+            if not self._confirm_from_pipe and not os.isatty(0):
+                # A piped / redirected stdin would feed us its next line
+                return False, (
+                    "Patch not applied: stdin is not a terminal "
+                    "(set CONFIRM_FROM_PIPE=true to read the answer from it)."
+                )
             try:
                 answer = input(f"\nApply patch to {path}? [y/N] ").strip().lower()
             except (EOFError, KeyboardInterrupt):
@@ -65,11 +97,18 @@ class PatchManager:
             if answer != "y":
                 return False, "Patch not applied."
 
+        backup_path = None
         if old_content is not None and self._backup:
             backup_path = self._backup_file(path)
-            print(f"  Backup saved: {backup_path}")
 
-        ok, msg = self._atomic_write(path, new_content)
+        ok, msg = self._atomic_write(path, new_content, durable=self._durable)
+        if backup_path is not None:
+            if ok:
+                print(f"  Backup saved: {backup_path}")
+            else:
+                # The backup may be a hardlink to the untouched original;
+                # leaving it would tie it to whatever edits *path* next.
+                os.unlink(backup_path)
         return ok, msg
 
     # ------------------------------------------------------------------
@@ -98,20 +137,20 @@ class PatchManager:
         if not diff:
             print("  (No changes detected in diff)")
             return
-        print(f"\n--- Diff for {path} ---")
-        # Colour output if tty
-        use_color = os.isatty(1)
-        for line in diff:
-            if use_color:
-                if line.startswith("+") and not line.startswith("+++"):
-                    print(f"\033[32m{line}\033[0m", end="")
-                elif line.startswith("-") and not line.startswith("---"):
-                    print(f"\033[31m{line}\033[0m", end="")
+        # Build the whole diff and emit it with one write.  Colour output if tty
+        parts = [f"\n--- Diff for {path} ---\n"]
+        if os.isatty(1):
+            for line in diff:
+                colour = _DIFF_COLOURS.get(line[0])
+                if colour is None or line.startswith(("+++", "---")):
+                    parts.append(line)
                 else:
-                    print(line, end="")
-            else:
-                print(line, end="")
-        print("\n--- End diff ---")
+                    parts.append(f"{colour}{line}\033[0m")
+        else:
+            parts.extend(diff)
+        parts.append("\n--- End diff ---\n")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
     def _backup_file(self, path: str) -> str:
         if not os.path.exists(self._backup_dir):
@@ -120,20 +159,26 @@ class PatchManager:
         base = os.path.basename(path)
         ts = time.strftime("%Y%m%d_%H%M%S")
         backup = os.path.join(self._backup_dir, f"{base}.{ts}.bak")
-        shutil.copy2(path, backup)
-
-        # Rotation
-        backups = sorted(
-            [
-                os.path.join(self._backup_dir, f)
-                for f in os.listdir(self._backup_dir)
-                if f.startswith(base) and f.endswith(".bak")
-            ],
-            key=os.path.getmtime,
-        )
+        # A hardlink is O(1) and stays valid: _atomic_write replaces *path*
+        # with a new inode, leaving the backup on the original one.  Fall
+        # back to a real copy across devices or on filesystems without links.
+        try:
+            os.link(path, backup)
+        except OSError:
+            shutil.copy2(path, backup)
+
+        # Rotation: snapshot (mtime, path) in one scandir pass, sort once.
+        # Matching "<base>." keeps e.g. "a.pyx" backups out of "a.py" rotation.
+        prefix = base + "."
+        with os.scandir(self._backup_dir) as it:
+            backups = sorted(
+                (e.stat().st_mtime, e.path)
+                for e in it
+                if e.name.startswith(prefix) and e.name.endswith(".bak")
+            )
 
-        while len(backups) > self._backup_count:
-            oldest = backups.pop(0)
+        excess = len(backups) - self._backup_count
+        for _, oldest in backups[: max(excess, 0)]:
             try:
                 os.remove(oldest)
             except Exception as exc:
@@ -144,17 +189,43 @@ class PatchManager:
         return backup
 
     @staticmethod
-    def _atomic_write(path: str, content: str) -> tuple[bool, str]:
+    def _atomic_write(
+        path: str, content: str, durable: bool = False
+    ) -> tuple[bool, str]:
         dir_name = os.path.dirname(path) or "."
+        # Encode once and write the bytes with raw os.write calls (no text
+        # wrapper); newlines are translated as text-mode open() would
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        data = memoryview(content.encode("utf-8"))
         try:
             fd, tmp = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as fh:
-                    fh.write(content)
+                try:
+                    while data:
+                        data = data[os.write(fd, data) :]
+                    if durable:
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
                 os.replace(tmp, path)
-                return True, f"File written: {path}"
             except Exception:
                 os.unlink(tmp)
                 raise
+            if durable:
+                _fsync_dir(dir_name)
+            return True, f"File written: {path}"
         except Exception as exc:
             return False, f"Write failed: {exc}"
+
+
+def _fsync_dir(dir_name: str) -> None:
+    """Flush a directory entry (the rename) to disk where the OS allows it."""
+    flags = getattr(os, "O_DIRECTORY", None)
+    if flags is None:  # Windows: directories cannot be opened for fsync
+        return
+    dfd = os.open(dir_name, os.O_RDONLY | flags)
+    try:
+        os.fsync(dfd)
+    finally:
+        os.close(dfd)
@@ -5,7 +5,44 @@ Supports: PDF, Word, Excel, CSV, JSON, XML, HTML, RTF, ODT, PowerPoint, and plai
 
 from __future__ import annotations
 
-from typing import Optional
+import csv
+import importlib
+import io
+import json
+from typing import Any, Optional
+
+# Tried in order by FileReaders.read_text
+_TEXT_ENCODINGS = ("utf-8", "latin-1", "cp1252", "iso-8859-1")
+
+# module name -> imported module, or None when it is not installed
+_optional_modules: dict[str, Any] = {}
+
+
+def _optional_import(name: str) -> Any:
+    """Import an optional reader dependency on first use and memoize it.
+
+    Returns ``None`` if the module is not installed; later calls are a
+    single dict lookup either way.
+    """
+    try:
+        return _optional_modules[name]
+    except KeyError:
+        pass
+    try:
+        module: Any = importlib.import_module(name)
+    except ImportError:
+        module = None
+    _optional_modules[name] = module
+    return module
+
+
+def _strip_last_newline(buf: io.StringIO) -> str:
+    """Return *buf* without its final newline (i.e. like ``"\\n".join``)."""
+    end = buf.tell()
+    if end:
+        buf.seek(end - 1)
+        buf.truncate()
+    return buf.getvalue()
 
 
 class FileReaders:
@@ -15,26 +52,30 @@ class FileReaders:
     def read_text(path: str) -> tuple[Optional[str], Optional[str]]:
         """Read plain text files."""
         try:
-            with open(path, "r", encoding="utf-8") as fh:
-                return fh.read(), None
-        except UnicodeDecodeError:
-            # Try with different encodings
-            for encoding in ["latin-1", "cp1252", "iso-8859-1"]:
-                try:
-                    with open(path, "r", encoding=encoding) as fh:
-                        return fh.read(), None
-                except UnicodeDecodeError:
-                    continue
-            return None, "Unable to decode file with common encodings"
+            # Read the bytes once; each fallback encoding decodes in memory
+            # instead of reopening and re-reading the file
+            with open(path, "rb") as fh:
+                data = fh.read()
         except Exception as exc:
             return None, f"Read error: {exc}"
+        for encoding in _TEXT_ENCODINGS:
+            try:
+                text = data.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+            # Match text-mode reads: translate \r\n and lone \r to \n
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return text, None
+        return None, "Unable to decode file with common encodings"
 
     @staticmethod
     def read_pdf(path: str) -> tuple[Optional[str], Optional[str]]:
         """Extract text from PDF files."""
+        pypdf = _optional_import("pypdf")
+        if pypdf is None:
+            return None, "pypdf not installed. Install with: pip install pypdf"
         try:
-            import pypdf  # type: ignore[import-not-found]
-
             text_content = []
             with open(path, "rb") as file:
                 pdf_reader = pypdf.PdfReader(file)
@@ -44,17 +85,19 @@ class FileReaders:
                         f"--- Page {page_num + 1} ---\n{page.extract_text()}"
                     )
             return "\n\n".join(text_content), None
-        except ImportError:
-            return None, "pypdf not installed. Install with: pip install pypdf"
         except Exception as exc:
             return None, f"PDF read error: {exc}"
 
     @staticmethod
     def read_word(path: str) -> tuple[Optional[str], Optional[str]]:
         """Extract text from Word documents (.docx, .doc)."""
+        docx = _optional_import("docx")
+        if docx is None:
+            return (
+                None,
+                "python-docx not installed. Install with: pip install python-docx",
+            )
         try:
-            import docx  # type: ignore[import-not-found]
-
             doc = docx.Document(path)
             text_content = []
 
@@ -75,39 +118,37 @@ class FileReaders:
                     )
 
             return "\n\n".join(text_content), None
-        except ImportError:
-            return (
-                None,
-                "python-docx not installed. Install with: pip install python-docx",
-            )
         except Exception as exc:
             return None, f"Word document read error: {exc}"
 
     @staticmethod
     def read_excel(path: str) -> tuple[Optional[str], Optional[str]]:
         """Extract data from Excel files (.xlsx, .xls)."""
+        openpyxl = _optional_import("openpyxl")
+        if openpyxl is None:
+            return None, "openpyxl not installed. Install with: pip install openpyxl"
         try:
-            import openpyxl
-
             workbook = openpyxl.load_workbook(path, data_only=True)
-            text_content = []
+            # Stream lines into one buffer; output matches "\n".join(lines)
+            buf = io.StringIO()
+            write = buf.write
 
             for sheet_name in workbook.sheetnames:
                 sheet = workbook[sheet_name]
-                text_content.append(f"=== Sheet: {sheet_name} ===")
+                write(f"=== Sheet: {sheet_name} ===\n")
 
                 for row in sheet.iter_rows(values_only=True):
                     # Filter out completely empty rows
                     if any(cell is not None for cell in row):
-                        row_text = " | ".join(
-                            str(cell) if cell is not None else "" for cell in row
+                        write(
+                            " | ".join(
+                                str(cell) if cell is not None else "" for cell in row
+                            )
                         )
-                        text_content.append(row_text)
-                text_content.append("")  # Empty line between sheets
+                        write("\n")
+                write("\n")  # Empty line between sheets
 
-            return "\n".join(text_content), None
-        except ImportError:
-            return None, "openpyxl not installed. Install with: pip install openpyxl"
+            return _strip_last_newline(buf), None
         except Exception as exc:
             return None, f"Excel read error: {exc}"
 
@@ -115,14 +156,13 @@ class FileReaders:
     def read_csv(path: str) -> tuple[Optional[str], Optional[str]]:
         """Read CSV files."""
         try:
-            import csv
-
-            text_content = []
+            buf = io.StringIO()
+            write = buf.write
             with open(path, "r", encoding="utf-8", newline="") as file:
-                csv_reader = csv.reader(file)
-                for row in csv_reader:
-                    text_content.append(" | ".join(row))
-            return "\n".join(text_content), None
+                for row in csv.reader(file):
+                    write(" | ".join(row))
+                    write("\n")
+            return _strip_last_newline(buf), None
         except Exception as exc:
             return None, f"CSV read error: {exc}"
 
@@ -130,8 +170,6 @@ class FileReaders:
     def read_json(path: str) -> tuple[Optional[str], Optional[str]]:
         """Read and pretty-print JSON files."""
         try:
-            import json
-
             with open(path, "r", encoding="utf-8") as file:
                 data = json.load(file)
                 return json.dumps(data, indent=2, ensure_ascii=False), None
@@ -141,9 +179,13 @@ class FileReaders:
     @staticmethod
     def read_xml(path: str) -> tuple[Optional[str], Optional[str]]:
         """Read XML files."""
+        ET = _optional_import("defusedxml.ElementTree")
+        if ET is None:
+            return (
+                None,
+                "defusedxml not installed. Install with: pip install defusedxml",
+            )
         try:
-            from defusedxml import ElementTree as ET  # type: ignore[import-untyped]
-
             tree = ET.parse(path)
             root = tree.getroot()
             # Return the XML as formatted string
@@ -154,11 +196,13 @@ class FileReaders:
     @staticmethod
     def read_html(path: str) -> tuple[Optional[str], Optional[str]]:
         """Extract text from HTML files."""
+        bs4 = _optional_import("bs4")
+        if bs4 is None:
+            # Fallback to reading as plain text if BeautifulSoup not available
+            return FileReaders.read_text(path)
         try:
-            from bs4 import BeautifulSoup
-
             with open(path, "r", encoding="utf-8") as file:
-                soup = BeautifulSoup(file.read(), "html.parser")
+                soup = bs4.BeautifulSoup(file.read(), "html.parser")
                 # Remove script and style elements
                 for script in soup(["script", "style"]):
                     script.decompose()
@@ -170,50 +214,49 @@ class FileReaders:
                 )
                 text = "\n".join(chunk for chunk in chunks if chunk)
                 return text, None
-        except ImportError:
-            # Fallback to reading as plain text if BeautifulSoup not available
-            return FileReaders.read_text(path)
         except Exception as exc:
             return None, f"HTML read error: {exc}"
 
     @staticmethod
     def read_rtf(path: str) -> tuple[Optional[str], Optional[str]]:
         """Extract text from RTF files."""
+        striprtf = _optional_import("striprtf.striprtf")
+        if striprtf is None:
+            return None, "striprtf not installed. Install with: pip install striprtf"
         try:
-            from striprtf.striprtf import rtf_to_text  # type: ignore[import-not-found]
-
             with open(path, "r", encoding="utf-8") as file:
                 rtf_content = file.read()
-                text = rtf_to_text(rtf_content)
+                text = striprtf.rtf_to_text(rtf_content)
                 return text, None
-        except ImportError:
-            return None, "striprtf not installed. Install with: pip install striprtf"
         except Exception as exc:
             return None, f"RTF read error: {exc}"
 
     @staticmethod
     def read_odt(path: str) -> tuple[Optional[str], Optional[str]]:
         """Extract text from ODT (OpenDocument Text) files."""
+        odfdo = _optional_import("odfdo")
+        if odfdo is None:
+            return None, "odfdo not installed. Install with: pip install odfdo"
         try:
-            from odfdo import Document  # type: ignore[import-not-found]
-
-            doc = Document(path)
+            doc = odfdo.Document(path)
             text_content = []
             for paragraph in doc.body.paragraphs:
                 text_content.append(paragraph.text)
             return "\n\n".join(text_content), None
-        except ImportError:
-            return None, "odfdo not installed. Install with: pip install odfdo"
         except Exception as exc:
             return None, f"ODT read error: {exc}"
 
     @staticmethod
     def read_powerpoint(path: str) -> tuple[Optional[str], Optional[str]]:
         """Extract text from PowerPoint files."""
+        pptx = _optional_import("pptx")
+        if pptx is None:
+            return (
+                None,
+                "python-pptx not installed. Install with: pip install python-pptx",
+            )
         try:
-            from pptx import Presentation  # type: ignore[import-not-found]
-
-            prs = Presentation(path)
+            prs = pptx.Presentation(path)
             text_content = []
 
             for slide_num, slide in enumerate(prs.slides, 1):
@@ -224,10 +267,5 @@ class FileReaders:
                 text_content.append("")  # Empty line between slides
 
             return "\n".join(text_content), None
-        except ImportError:
-            return (
-                None,
-                "python-pptx not installed. Install with: pip install python-pptx",
-            )
         except Exception as exc:
             return None, f"PowerPoint read error: {exc}"
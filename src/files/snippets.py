@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from bisect import bisect_left
+from typing import Iterator, Optional
 
 
 class SnippetManager:
@@ -11,17 +12,51 @@ class SnippetManager:
     without loading full files.
     """
 
+    __slots__ = ("_snippets", "_sorted_lower", "_sorted_orig")
+
     def __init__(self) -> None:
         self._snippets: dict[str, str] = {}
+        # Parallel sorted lists of (lowercased name, name) for prefix lookup
+        self._sorted_lower: list[str] = []
+        self._sorted_orig: list[str] = []
 
     def save(self, name: str, code: str) -> None:
+        if name not in self._snippets:
+            i = self._index_of(name)
+            self._sorted_lower.insert(i, name.lower())
+            self._sorted_orig.insert(i, name)
         self._snippets[name] = code
 
     def get(self, name: str) -> Optional[str]:
         return self._snippets.get(name)
 
     def delete(self, name: str) -> bool:
-        return self._snippets.pop(name, None) is not None
+        if self._snippets.pop(name, None) is None:
+            return False
+        i = self._index_of(name)
+        del self._sorted_lower[i]
+        del self._sorted_orig[i]
+        return True
+
+    def complete_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield names starting with *prefix* (case-insensitive), sorted."""
+        key = prefix.lower()
+        lower, orig = self._sorted_lower, self._sorted_orig
+        i = bisect_left(lower, key)
+        n = len(lower)
+        while i < n and lower[i].startswith(key):
+            yield orig[i]
+            i += 1
+
+    def _index_of(self, name: str) -> int:
+        """Position of *name* in the sorted index (ties broken by original)."""
+        lower, orig = self._sorted_lower, self._sorted_orig
+        key = name.lower()
+        i = bisect_left(lower, key)
+        n = len(lower)
+        while i < n and lower[i] == key and orig[i] < name:
+            i += 1
+        return i
 
     def list_names(self) -> list[str]:
         return list(self._snippets.keys())
@@ -0,0 +1,22 @@
+"""Shared path helpers."""
+
+from __future__ import annotations
+
+import functools
+import os
+
+
+def abspath(path: str) -> str:
+    """:func:`os.path.abspath`, memoized for absolute inputs.
+
+    Relative paths depend on the current working directory, so they are
+    resolved afresh on every call and never cached.
+    """
+    if not os.path.isabs(path):
+        return os.path.abspath(path)
+    return _normalized_abspath(path)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalized_abspath(path: str) -> str:
+    return os.path.abspath(path)
@@ -27,6 +27,8 @@ class SessionManager:
     - Delegates display to the Display helper
     """
 
+    __slots__ = ("_provider", "_ctx", "_display", "_temperature", "_max_tokens")
+
     def __init__(
         self,
         provider: ModelProvider,
@@ -51,55 +53,126 @@ class SessionManager:
                                Pass False for internal prompts (e.g. /fix generates a
                                structured prompt that should still be recorded).
         """
-        if record_in_history:
-            self._ctx.add_user(user_message)
+        messages = self._prepare(user_message, record_in_history)
+        if messages is None:
+            return None
 
-        messages = self._ctx.build_messages(
-            ephemeral_user_content=None if record_in_history else user_message
-        )
-
-        disp: Any = self._display if self._display else _NullDisplay()
-        full_response = ""
+        disp = self._active_display()
+        parts: list[str] = []
+        # Bound once: the loop body runs per token
+        show, think, append = disp.stream, disp.reasoning, parts.append
 
         try:
             for chunk in self._provider.stream(
                 messages, self._temperature, self._max_tokens
             ):
                 if chunk.reasoning:
-                    disp.reasoning(chunk.reasoning)
-                if chunk.content:
-                    disp.stream(chunk.content)
-                    full_response += chunk.content
+                    think(chunk.reasoning)
+                content = chunk.content
+                if content:
+                    show(content)
+                    append(content)
+            disp.flush_stream()
         except (KeyboardInterrupt, RuntimeError) as e:
             if not self._display:
                 raise
-            if isinstance(e, KeyboardInterrupt):
-                disp.info("\n[Stream interrupted by user]")
-            else:
-                disp.error(str(e))
+            self._report(disp, e)
 
-        disp.newline()
+        return self._finish(disp, parts)
+
+    async def send_async(
+        self, user_message: str, record_in_history: bool = True
+    ) -> Optional[str]:
+        """Async counterpart of :meth:`send` built on ``provider.async_stream``.
 
-        if full_response:
-            self._ctx.add_assistant(full_response)
+        Same history semantics as :meth:`send`; the event loop stays free
+        between chunks instead of blocking on the socket.
+        """
+        messages = self._prepare(user_message, record_in_history)
+        if messages is None:
+            return None
 
-        return full_response or None
+        disp = self._active_display()
+        parts: list[str] = []
+        # Bound once: the loop body runs per token
+        show, think, append = disp.stream, disp.reasoning, parts.append
+
+        try:
+            async for chunk in self._provider.async_stream(
+                messages, self._temperature, self._max_tokens
+            ):
+                if chunk.reasoning:
+                    think(chunk.reasoning)
+                content = chunk.content
+                if content:
+                    show(content)
+                    append(content)
+            disp.flush_stream()
+        except (KeyboardInterrupt, RuntimeError) as e:
+            if not self._display:
+                raise
+            self._report(disp, e)
+
+        return self._finish(disp, parts)
 
     async def stream_async(self, user_input: str) -> AsyncIterator[StreamChunk]:
         """Async streaming for Textual app. Yields chunks without Display dependency."""
-        self._ctx.add_user(user_input)
-        messages = self._ctx.build_messages()
+        messages = self._prepare(user_input, record_in_history=True)
+        if messages is None:
+            return
 
-        full_response = ""
+        parts: list[str] = []
         async for chunk in self._provider.async_stream(
             messages, self._temperature, self._max_tokens
         ):
             if chunk.content:
-                full_response += chunk.content
+                parts.append(chunk.content)
             yield chunk
 
-        if full_response:
-            self._ctx.add_assistant(full_response)
+        self._record_reply(parts)
 
     def reset(self) -> None:
         self._ctx.reset_convo()
+
+    # ------------------------------------------------------------------
+    # Shared by send / send_async / stream_async
+    # ------------------------------------------------------------------
+
+    def _prepare(
+        self, user_message: str, record_in_history: bool
+    ) -> Optional[list[dict]]:
+        """Record the user turn (if asked) and return the request messages.
+
+        Returns None for a blank message: no provider round-trip and no
+        empty history entry.
+        """
+        if not user_message.strip():
+            return None
+        if record_in_history:
+            self._ctx.add_user(user_message)
+            return self._ctx.build_messages()
+        return self._ctx.build_messages_with_ephemeral(user_message)
+
+    def _active_display(self) -> Any:
+        return self._display if self._display else _NullDisplay()
+
+    @staticmethod
+    def _report(disp: Any, error: BaseException) -> None:
+        """Show an interrupted or failed stream on the display."""
+        if isinstance(error, KeyboardInterrupt):
+            disp.info("\n[Stream interrupted by user]")
+        else:
+            disp.error(str(error))
+
+    def _finish(self, disp: Any, parts: list[str]) -> Optional[str]:
+        """End the display's stream and record the reply joined from *parts*."""
+        disp.newline()
+        return self._record_reply(parts)
+
+    def _record_reply(self, parts: list[str]) -> Optional[str]:
+        # parts holds only non-empty deltas, so empty means no reply at all
+        if not parts:
+            return None
+        full_response = "".join(parts)
+        self._ctx.add_assistant(full_response)
+        return full_response
@@ -0,0 +1,130 @@
+"""Tests for REPL tab completion."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from src.cli.completer import CLICompleter, _Trie
+from src.context.manager import ContextManager
+from src.files.manager import FileManager
+from src.files.snippets import SnippetManager
+
+_COMMANDS = ("/file", "/fix", "/folder", "/help", "/show", "/snippet", "/unload")
+
+
+# ---------------------------------------------------------------------------
+# _Trie
+# ---------------------------------------------------------------------------
+
+
+def test_trie_words_are_sorted_regardless_of_insert_order() -> None:
+    words = ["/unload", "/f", "/fix", "/file", "/folder", "/help"]
+    trie = _Trie.build(words)
+
+    assert list(trie.words("")) == sorted(words)
+    assert list(trie.words("/f")) == ["/f", "/file", "/fix", "/folder"]
+    assert list(trie.words("/fi")) == ["/file", "/fix"]
+
+
+def test_trie_unknown_prefix() -> None:
+    trie = _Trie.build(["/help"])
+
+    assert list(trie.words("/x")) == []
+    assert trie.descend("/helpme") is None
+
+
+# ---------------------------------------------------------------------------
+# CLICompleter
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def files() -> FileManager:
+    context = ContextManager("system", 10_000, 1_000, 20)
+    return FileManager(context=context, max_files=10, default_extensions=("*.py",))
+
+
+@pytest.fixture
+def snippets() -> SnippetManager:
+    manager = SnippetManager()
+    for name in ("Alpha", "alphabet", "beta"):
+        manager.save(name, "x = 1")
+    return manager
+
+
+@pytest.fixture
+def completer(files: FileManager, snippets: SnippetManager) -> CLICompleter:
+    return CLICompleter(lambda: _COMMANDS, files, snippets)
+
+
+def test_completes_commands(completer: CLICompleter) -> None:
+    assert completer.get_completions("/f") == ["/file", "/fix", "/folder"]
+    assert completer.get_completions("/zzz") == []
+
+
+def test_picks_up_changed_command_set(
+    files: FileManager, snippets: SnippetManager
+) -> None:
+    commands = ["/help"]
+    completer = CLICompleter(lambda: tuple(commands), files, snippets)
+    assert completer.get_completions("/h") == ["/help"]
+
+    commands.append("/history")
+    assert completer.get_completions("/h") == ["/help", "/history"]
+
+
+def test_completes_paths(
+    completer: CLICompleter, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "setup.py").write_text("")
+    (tmp_path / "readme.md").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    assert completer.get_completions("/file s") == ["setup.py", "src/"]
+    assert completer.get_completions("/folder sr") == ["src/"]
+    assert completer.get_completions("s") == ["setup.py", "src/"]
+
+    # A new entry changes the directory listing and is picked up
+    (tmp_path / "src" / "main.py").write_text("")
+    assert completer.get_completions("/file src/") == [os.path.join("src", "main.py")]
+    assert completer.get_completions("/file missing/") == []
+
+
+def test_completes_loaded_files(
+    completer: CLICompleter, files: FileManager, tmp_path: Path
+) -> None:
+    paths = []
+    for name in ("Beta.py", "alpha.py"):
+        target = tmp_path / name
+        target.write_text("pass\n")
+        ok, _ = files.load(str(target))
+        assert ok
+        paths.append(files.loaded_paths()[-1])
+    base = str(tmp_path) + os.sep
+
+    assert completer.get_completions(f"/show {base}") == sorted(paths, key=str.lower)
+    assert completer.get_completions(f"/show {base}b") == [paths[0]]
+    # Only the first argument completes
+    assert completer.get_completions(f"/fix {paths[0]} ") == []
+
+    files.unload(paths[0])
+    assert completer.get_completions(f"/show {base}") == [paths[1]]
+
+
+def test_completes_snippet_subcommands_and_names(
+    completer: CLICompleter, snippets: SnippetManager
+) -> None:
+    assert completer.get_completions("/snippet ") == ["del", "list", "save", "show"]
+    assert completer.get_completions("/snippet S") == ["save", "show"]
+    assert completer.get_completions("/snippet show al") == ["Alpha", "alphabet"]
+    assert completer.get_completions("/snippet save al") == []
+
+    snippets.delete("Alpha")
+    assert completer.get_completions("/snippet del AL") == ["alphabet"]
+
+
+def test_unknown_command_has_no_argument_completions(completer: CLICompleter) -> None:
+    assert completer.get_completions("/help ") == []
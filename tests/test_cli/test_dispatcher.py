@@ -0,0 +1,61 @@
+"""Tests for :class:`CommandDispatcher` command routing."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from src.cli.dispatcher import CommandDispatcher
+from src.context.manager import ContextManager
+from src.files.manager import FileManager
+from src.files.patching import PatchManager
+from src.files.snippets import SnippetManager
+from src.session.manager import SessionManager
+
+
+@pytest.fixture
+def dispatcher() -> CommandDispatcher:
+    context = ContextManager("system", 10_000, 2_000, 20)
+    files = FileManager(context=context, max_files=5, default_extensions=("*.py",))
+    session = SessionManager(
+        provider=None,  # type: ignore[arg-type]
+        context=context,
+        display=None,
+        temperature=0.0,
+        max_tokens=16,
+    )
+    return CommandDispatcher(
+        session=session,
+        files=files,
+        context=context,
+        patch=PatchManager(backup=False, diff_preview=False),
+        snippets=SnippetManager(),
+        max_file_chars=4,
+    )
+
+
+@pytest.mark.parametrize("size", [2, 10])
+def test_show_sync_and_async_match(
+    dispatcher: CommandDispatcher,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    size: int,
+) -> None:
+    target = tmp_path / "mod.py"
+    target.write_text("[bold]x" * size)
+    path = str(target)
+    assert dispatcher.dispatch(f"/file {path}")
+    capsys.readouterr()
+
+    assert dispatcher.dispatch(f"/show {path}")
+    sync_out = capsys.readouterr().out
+    async_out = asyncio.run(dispatcher.dispatch_async(f"/show {path}"))
+
+    assert sync_out == async_out + "\n"
+    assert "[bold]" not in sync_out
+    assert ("…" in sync_out) == (size * 7 > 16)
+
+
+def test_show_usage(dispatcher: CommandDispatcher) -> None:
+    assert asyncio.run(dispatcher.dispatch_async("/show")) == "Usage: /show <path>"
@@ -0,0 +1,47 @@
+"""Tests for :class:`REPL` exit confirmation."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+
+import pytest
+from src.cli import output
+from src.cli.repl import REPL
+from src.config import Config
+
+
+def _repl(confirm_from_pipe: bool) -> REPL:
+    # _confirm_and_exit only touches the config and the running flag
+    repl = object.__new__(REPL)
+    repl._config = dataclasses.replace(Config(), CONFIRM_FROM_PIPE=confirm_from_pipe)
+    repl._running = True
+    return repl
+
+
+def test_exit_skips_confirmation_when_stdin_is_not_a_terminal(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(os, "isatty", lambda fd: False)
+
+    def no_confirm(prompt: str = "") -> bool:
+        raise AssertionError("stdin must not be read")
+
+    monkeypatch.setattr(output, "confirm", no_confirm)
+    repl = _repl(confirm_from_pipe=False)
+    repl._confirm_and_exit()
+
+    assert repl._running is False
+
+
+@pytest.mark.parametrize(("tty", "confirm_from_pipe"), [(True, False), (False, True)])
+@pytest.mark.parametrize("answer", [True, False])
+def test_exit_asks_for_confirmation(
+    monkeypatch: pytest.MonkeyPatch, tty: bool, confirm_from_pipe: bool, answer: bool
+) -> None:
+    monkeypatch.setattr(os, "isatty", lambda fd: tty)
+    monkeypatch.setattr(output, "confirm", lambda prompt="": answer)
+    repl = _repl(confirm_from_pipe=confirm_from_pipe)
+    repl._confirm_and_exit()
+
+    assert repl._running is (not answer)
@@ -0,0 +1,184 @@
+"""Tests for :class:`NvidiaProvider` streaming: retries and SSE parsing."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from src.client import nvidia
+from src.client.nvidia import NvidiaProvider
+
+_OK_BODY = b'data: {"choices":[{"delta":{"content":"hi"}}]}\n\ndata: [DONE]\n\n'
+
+
+def _provider(transport: httpx.MockTransport, retries: int = 3) -> NvidiaProvider:
+    provider = NvidiaProvider(
+        api_key="k",
+        base_url="https://api.test/v1",
+        model="m",
+        max_retries=retries,
+        retry_delay=0.0,
+    )
+    provider._http = httpx.Client(transport=transport)
+    return provider
+
+
+def _collect(provider: NvidiaProvider) -> list[str]:
+    return [c.content for c in provider.stream([], 0.0, 16)]
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    slept: list[float] = []
+    monkeypatch.setattr(nvidia.time, "sleep", slept.append)
+    return slept
+
+
+# ---------------------------------------------------------------------------
+# Retries
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("status", [408, 409, 429, 500, 502, 503, 504])
+def test_transient_status_is_retried(status: int) -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(status, text="busy")
+        return httpx.Response(200, content=_OK_BODY)
+
+    assert _collect(_provider(httpx.MockTransport(handler))) == ["hi"]
+    assert len(calls) == 2
+
+
+def test_client_error_is_not_retried() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(400, text="bad request")
+
+    with pytest.raises(RuntimeError, match="HTTP 400"):
+        _collect(_provider(httpx.MockTransport(handler)))
+    assert len(calls) == 1
+
+
+def test_retry_after_overrides_backoff(_no_sleep: list[float]) -> None:
+    responses = iter(
+        [
+            httpx.Response(503, headers={"Retry-After": "2"}),
+            httpx.Response(200, content=_OK_BODY),
+        ]
+    )
+    provider = _provider(httpx.MockTransport(lambda _: next(responses)))
+
+    assert _collect(provider) == ["hi"]
+    assert _no_sleep == [2.0]
+
+
+def test_retries_exhausted() -> None:
+    provider = _provider(httpx.MockTransport(lambda _: httpx.Response(503)), retries=2)
+    with pytest.raises(RuntimeError, match="All 2 retries failed"):
+        _collect(provider)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("1.5", 1.5),
+        ("-3", 0.0),
+        ("9999", 60.0),
+        ("nan", None),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    assert nvidia._parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    assert nvidia._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert nvidia._parse_retry_after("not a date") is None
+
+
+# ---------------------------------------------------------------------------
+# SSE framing and parsing
+# ---------------------------------------------------------------------------
+
+_EVENTS = (
+    b": keep-alive\r\n"
+    b"event: message\r\n"
+    b'data: {"choices":[{"delta":{"content":"h\xc3\xa9"}}]}\r\n'
+    b"\r\n"
+    b'data:{"choices":[{"delta":{"reasoning_content":"think"}}]}\n\n'
+    b'data: {"choices":[{"delta":{}}]}\n\n'
+    b'data: {"choices":[]}\n\n'
+    b'data: {"choices":[{"delta":{"content":"!","reasoning_content":"r"}}]}\n\n'
+    b"data: [DONE]\n\n"
+    b'data: {"choices":[{"delta":{"content":"after done"}}]}\n\n'
+)
+_EXPECTED = [("hé", ""), ("", "think"), ("!", "r")]
+
+
+def _parse(blocks: list[bytes]) -> list[tuple[str, str]]:
+    lines = NvidiaProvider._split_lines(blocks)
+    return [(c.content, c.reasoning) for c in NvidiaProvider._parse_sse(lines)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 17, len(_EVENTS)])
+def test_events_split_across_blocks(size: int) -> None:
+    blocks = [_EVENTS[i : i + size] for i in range(0, len(_EVENTS), size)]
+    assert _parse(blocks) == _EXPECTED
+
+
+def test_split_lines_keeps_unterminated_tail() -> None:
+    lines = NvidiaProvider._split_lines([b"a\r\nb", b"", b"c\nd"])
+    assert list(lines) == [b"a\r", b"bc", b"d"]
+
+
+def test_stream_ends_without_done() -> None:
+    body = b'data: {"choices":[{"delta":{"content":"x"}}]}'
+    assert _parse([body]) == [("x", "")]
+
+
+def test_malformed_event_raises() -> None:
+    with pytest.raises(RuntimeError, match="Malformed stream event: {oops"):
+        _parse([b"data: {oops\n\n"])
+
+
+def test_error_event_raises() -> None:
+    with pytest.raises(RuntimeError, match="API error"):
+        _parse([b'data: {"error": {"message": "quota"}}\n\n'])
+
+
+def test_yielded_chunks_are_independent() -> None:
+    chunks = list(NvidiaProvider._parse_sse(NvidiaProvider._split_lines([_EVENTS])))
+
+    assert len({id(c) for c in chunks}) == len(chunks)
+    assert [(c.content, c.reasoning) for c in chunks] == _EXPECTED
+
+
+def test_sdk_stream_chunks_are_independent() -> None:
+    def event(content: str | None, reasoning: str | None = None) -> SimpleNamespace:
+        delta = SimpleNamespace(content=content, reasoning_content=reasoning)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    completion = [
+        event("a"),
+        SimpleNamespace(choices=[]),
+        event(None, "r"),
+        event(None),
+        event("b"),
+    ]
+    chunks = list(NvidiaProvider._parse_stream(completion))
+
+    assert [(c.content, c.reasoning) for c in chunks] == [
+        ("a", ""),
+        ("", "r"),
+        ("b", ""),
+    ]
+    assert len({id(c) for c in chunks}) == len(chunks)
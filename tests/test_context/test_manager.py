@@ -0,0 +1,45 @@
+"""Tests for :class:`ContextManager` budget trimming."""
+
+from __future__ import annotations
+
+import pytest
+from src.context.manager import ContextManager
+
+
+def _contents(ctx: ContextManager) -> list[str]:
+    return [m["content"] for m in ctx.build_messages()[1:]]
+
+
+@pytest.mark.parametrize("window", [1, 3, 50])
+def test_oldest_messages_are_trimmed_to_budget(window: int) -> None:
+    # System prompt "sys" is 1 token; each message below is 10 tokens
+    ctx = ContextManager("sys", 41, 100, window)
+    for i in range(120):
+        ctx.add_user(f"{i:03d}" + "x" * 37)
+
+    kept = _contents(ctx)
+    assert len(kept) == min(window, 4)
+    assert kept[-1].startswith("119")
+    assert ctx.convo_tokens == 10 * min(window, 120)
+
+
+def test_ephemeral_message_forces_extra_trim() -> None:
+    ctx = ContextManager("sys", 41, 100, 10)
+    for i in range(4):
+        ctx.add_assistant(f"{i}" + "x" * 39)
+
+    assert len(_contents(ctx)) == 4
+    with_ephemeral = ctx.build_messages_with_ephemeral("y" * 40)
+    assert [m["content"][0] for m in with_ephemeral[1:]] == ["1", "2", "3", "y"]
+    # The cached request is unaffected
+    assert len(_contents(ctx)) == 4
+
+
+def test_reset_clears_trim_state() -> None:
+    ctx = ContextManager("sys", 41, 100, 2)
+    for _ in range(10):
+        ctx.add_user("x" * 40)
+    ctx.reset_convo()
+    ctx.add_user("a" * 40)
+
+    assert _contents(ctx) == ["a" * 40]
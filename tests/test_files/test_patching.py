@@ -0,0 +1,90 @@
+"""Tests for :class:`PatchManager` writes and backups."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from src.files.patching import PatchManager
+
+
+@pytest.fixture
+def patcher(tmp_path: Path) -> PatchManager:
+    manager = PatchManager(backup=True, diff_preview=False)
+    manager._backup_dir = str(tmp_path / "backups")
+    return manager
+
+
+def _backups(tmp_path: Path) -> list[Path]:
+    backup_dir = tmp_path / "backups"
+    return sorted(backup_dir.iterdir()) if backup_dir.exists() else []
+
+
+def test_backup_keeps_original_after_successful_patch(
+    patcher: PatchManager, tmp_path: Path
+) -> None:
+    target = tmp_path / "a.py"
+    target.write_text("old\n", encoding="utf-8")
+
+    ok, _ = patcher.apply(str(target), "new\n", confirm=False)
+
+    assert ok
+    assert target.read_text(encoding="utf-8") == "new\n"
+    (backup,) = _backups(tmp_path)
+    assert backup.read_text(encoding="utf-8") == "old\n"
+    assert not os.path.samefile(backup, target)
+
+
+def test_failed_write_leaves_no_backup_linked_to_target(
+    patcher: PatchManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "a.py"
+    target.write_text("old\n", encoding="utf-8")
+
+    def fail_replace(src: str, dst: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    ok, msg = patcher.apply(str(target), "new\n", confirm=False)
+
+    assert not ok
+    assert "disk full" in msg
+    assert target.read_text(encoding="utf-8") == "old\n"
+    assert _backups(tmp_path) == []
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_confirm_declines_when_stdin_is_not_a_terminal(
+    patcher: PatchManager, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "a.py"
+    target.write_text("old\n", encoding="utf-8")
+    monkeypatch.setattr(os, "isatty", lambda fd: False)
+
+    def no_input(prompt: str = "") -> str:
+        raise AssertionError("stdin must not be read")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    ok, msg = patcher.apply(str(target), "new\n", confirm=True)
+
+    assert not ok
+    assert "stdin is not a terminal" in msg
+    assert "CONFIRM_FROM_PIPE" in msg
+    assert target.read_text(encoding="utf-8") == "old\n"
+
+
+@pytest.mark.parametrize(("answer", "applied"), [("y", True), ("n", False)])
+def test_confirm_from_pipe_reads_the_answer(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, answer: str, applied: bool
+) -> None:
+    patcher = PatchManager(backup=False, diff_preview=False, confirm_from_pipe=True)
+    target = tmp_path / "a.py"
+    target.write_text("old\n", encoding="utf-8")
+    monkeypatch.setattr(os, "isatty", lambda fd: False)
+    monkeypatch.setattr("builtins.input", lambda prompt="": answer)
+
+    ok, _ = patcher.apply(str(target), "new\n", confirm=True)
+
+    assert ok is applied
+    assert target.read_text(encoding="utf-8") == ("new\n" if applied else "old\n")
@@ -0,0 +1,32 @@
+"""Tests for :mod:`src.paths`."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from src.paths import abspath
+
+
+def test_relative_paths_follow_the_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert abspath(".") == str(first)
+    assert abspath("a/../b.py") == str(first / "b.py")
+
+    monkeypatch.chdir(second)
+    assert abspath(".") == str(second)
+    assert abspath("a/../b.py") == str(second / "b.py")
+
+
+def test_absolute_paths_are_normalized(tmp_path: Path) -> None:
+    raw = os.path.join(str(tmp_path), "x", "..", "y.py")
+    assert abspath(raw) == str(tmp_path / "y.py")
+    assert abspath(raw) == abspath(str(tmp_path / "y.py"))
@@ -0,0 +1,124 @@
+"""Tests for :class:`SessionManager` send paths."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Iterator, Optional
+
+import pytest
+from src.client.base import ModelProvider, StreamChunk
+from src.context.manager import ContextManager
+from src.session.manager import SessionManager
+
+
+class _ScriptedProvider(ModelProvider):
+    """Replays a fixed list of (content, reasoning) deltas, then maybe fails."""
+
+    def __init__(
+        self, deltas: list[tuple[str, str]], error: Optional[Exception] = None
+    ) -> None:
+        self.deltas = deltas
+        self.error = error
+        self.requests: list[list[dict]] = []
+
+    @property
+    def name(self) -> str:
+        return "scripted"
+
+    def stream(
+        self, messages: list[dict], temperature: float, max_tokens: int
+    ) -> Iterator[StreamChunk]:
+        self.requests.append(messages)
+        for content, reasoning in self.deltas:
+            yield StreamChunk(content, reasoning)
+        if self.error is not None:
+            raise self.error
+
+    async def async_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> AsyncIterator[StreamChunk]:
+        for chunk in self.stream(messages, temperature, max_tokens):
+            yield chunk
+
+
+class _RecordingDisplay:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def __getattr__(self, name: str) -> object:
+        return lambda *args: self.calls.append((name, "".join(args)))
+
+
+def _session(
+    provider: ModelProvider, display: object = None
+) -> tuple[SessionManager, ContextManager]:
+    ctx = ContextManager("system", 10_000, 1_000, 20)
+    return SessionManager(provider, ctx, display, 0.0, 16), ctx
+
+
+def _send(session: SessionManager, mode: str, *args: object) -> Optional[str]:
+    if mode == "sync":
+        return session.send(*args)  # type: ignore[arg-type]
+    return asyncio.run(session.send_async(*args))  # type: ignore[arg-type]
+
+
+@pytest.fixture(params=["sync", "async"])
+def mode(request: pytest.FixtureRequest) -> str:
+    return str(request.param)
+
+
+def test_reply_is_joined_and_recorded(mode: str) -> None:
+    display = _RecordingDisplay()
+    session, ctx = _session(
+        _ScriptedProvider([("a", ""), ("", "r"), ("b", "")]), display
+    )
+
+    assert _send(session, mode, "hi") == "ab"
+    assert ctx.build_messages()[-2:] == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "ab"},
+    ]
+    assert display.calls == [
+        ("stream", "a"),
+        ("reasoning", "r"),
+        ("stream", "b"),
+        ("flush_stream", ""),
+        ("newline", ""),
+    ]
+
+
+def test_ephemeral_prompt_is_not_recorded(mode: str) -> None:
+    provider = _ScriptedProvider([("ok", "")])
+    session, ctx = _session(provider)
+
+    assert _send(session, mode, "prompt", False) == "ok"
+    assert provider.requests[0][-1] == {"role": "user", "content": "prompt"}
+    assert ctx.build_messages()[-1] == {"role": "assistant", "content": "ok"}
+
+
+def test_blank_message_skips_provider(mode: str) -> None:
+    provider = _ScriptedProvider([("x", "")])
+    session, ctx = _session(provider)
+
+    assert _send(session, mode, "   ") is None
+    assert provider.requests == []
+    assert ctx.build_messages() == [{"role": "system", "content": "system"}]
+
+
+def test_error_without_display_propagates(mode: str) -> None:
+    session, _ = _session(_ScriptedProvider([], RuntimeError("boom")))
+    with pytest.raises(RuntimeError, match="boom"):
+        _send(session, mode, "hi")
+
+
+def test_error_with_display_keeps_partial_reply(mode: str) -> None:
+    display = _RecordingDisplay()
+    provider = _ScriptedProvider([("part", "")], RuntimeError("boom"))
+    session, _ = _session(provider, display)
+
+    assert _send(session, mode, "hi") == "part"
+    assert ("error", "boom") in display.calls
+    assert display.calls[-1] == ("newline", "")